@@ -4,34 +4,48 @@ Uses Jinja2 + WeasyPrint; writes to BytesIO and returns bytes.
 """
 
 import io
+import math
 import os
 import re
+import threading
+from functools import cache
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 from weasyprint import CSS, HTML
 from weasyprint.text.fonts import FontConfiguration
 
+_TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
+
+# Pango font maps are only safe to use from one thread, and PDFs are
+# generated in asyncio.to_thread workers, so each thread keeps its own
+# FontConfiguration and the stylesheet parsed against it
+_thread_local = threading.local()
+
 
 def _format_currency(value: Any) -> str:
     try:
-        if isinstance(value, str):
-            value = float(value)
-        return f"{value:,.0f}"
+        return format(float(value), ",.0f")
     except (ValueError, TypeError):
         return str(value)
 
 
+def _amount_to_float(amount: Any) -> float:
+    if not amount:
+        return 0.0
+    if isinstance(amount, (int, float)):
+        # Amounts from the database are already numeric
+        return float(amount)
+    try:
+        return float(amount)
+    except (ValueError, TypeError):
+        return 0.0
+
+
 def _calculate_totals(
     items: list[dict[str, Any]], invoice_type: str = ""
 ) -> dict[str, float]:
-    subtotal = 0.0
-    for item in items:
-        try:
-            amount = float(item.get("amount", 0)) if item.get("amount") else 0
-            subtotal += amount
-        except (ValueError, TypeError):
-            continue
+    subtotal = math.fsum(_amount_to_float(item.get("amount")) for item in items)
     if invoice_type == "三聯":
         tax_rate = 0.05
         tax_amount = subtotal * tax_rate
@@ -115,13 +129,41 @@ def _prepare_invoice_data(invoice_data: dict[str, Any]) -> dict[str, Any]:
         "address": invoice_data.get("address", ""),
         "item_list": processed_items,
         "totals": {
-            "subtotal": _format_currency(totals["subtotal"]),
-            "tax": _format_currency(totals["tax"]),
-            "total": _format_currency(totals["total"]),
+            "subtotal": f"{totals['subtotal']:,.0f}",
+            "tax": f"{totals['tax']:,.0f}",
+            "total": f"{totals['total']:,.0f}",
         },
     }
 
 
+@cache
+def _get_template(template_name: str) -> Template:
+    """Compile a template once per process; templates ship with the app."""
+    jinja_env = Environment(
+        loader=FileSystemLoader(_TEMPLATE_DIR),
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+    )
+    return jinja_env.get_template(template_name)
+
+
+def _get_pdf_resources() -> tuple[FontConfiguration, list[CSS]]:
+    """Font config and parsed styles.css for the current thread."""
+    resources = getattr(_thread_local, "pdf_resources", None)
+    if resources is None:
+        font_config = FontConfiguration()
+        css_path = os.path.join(_TEMPLATE_DIR, "styles.css")
+        stylesheets = (
+            [CSS(filename=css_path, font_config=font_config)]
+            if os.path.exists(css_path)
+            else []
+        )
+        resources = _thread_local.pdf_resources = (font_config, stylesheets)
+    return resources
+
+
 def generate_pdf_bytes(invoice_data: dict[str, Any]) -> bytes:
     """
     Generate PDF bytes for one invoice (請款單).
@@ -135,33 +177,16 @@ def generate_pdf_bytes(invoice_data: dict[str, Any]) -> bytes:
     Returns:
         PDF file as bytes.
     """
-    template_dir = os.path.join(os.path.dirname(__file__), "templates")
-    jinja_env = Environment(
-        loader=FileSystemLoader(template_dir),
-        autoescape=False,
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
-    font_config = FontConfiguration()
     prepared = _prepare_invoice_data(invoice_data)
-    template = jinja_env.get_template("invoice.html")
-    html_content = template.render(invoice=prepared)
+    html_content = _get_template("invoice.html").render(invoice=prepared)
     html_doc = HTML(string=html_content)
-    css_path = os.path.join(template_dir, "styles.css")
+    font_config, stylesheets = _get_pdf_resources()
     buffer = io.BytesIO()
-    if os.path.exists(css_path):
-        css_doc = CSS(filename=css_path, font_config=font_config)
-        html_doc.write_pdf(
-            buffer,
-            stylesheets=[css_doc],
-            font_config=font_config,
-            optimize_images=True,
-        )
-    else:
-        html_doc.write_pdf(
-            buffer,
-            font_config=font_config,
-            optimize_images=True,
-        )
+    html_doc.write_pdf(
+        buffer,
+        stylesheets=stylesheets,
+        font_config=font_config,
+        optimize_images=True,
+    )
     buffer.seek(0)
     return buffer.getvalue()
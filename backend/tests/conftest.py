@@ -4,15 +4,52 @@ import os
 
 os.environ.setdefault("RUN_DB_MIGRATIONS", "false")
 
+import asyncio
+
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
 
+from app.database.models.customer import Customer
 from app.database.session import get_session
 from app.main import app
 
+try:
+    import uvloop
+except ImportError:  # not installed on Windows, Cygwin or PyPy
+    uvloop = None
+
+
+async def seed_customers(session: AsyncSession, *rows: dict) -> list[Customer]:
+    """
+    Insert customers with a single multi-row INSERT ... RETURNING and commit,
+    returning them in the same order as the given rows
+    """
+    customers = (
+        await session.scalars(
+            insert(Customer).returning(Customer, sort_by_parameter_order=True),
+            list(rows),
+        )
+    ).all()
+    await session.commit()
+    return list(customers)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """
+    Run async tests on uvloop, the loop uvicorn[standard] serves the app with,
+    falling back to the default asyncio loop where uvloop is unavailable
+    (session scope, shared across entire test session)
+    """
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
 
 @pytest_asyncio.fixture(scope="session")
 async def test_engine():
@@ -26,6 +63,16 @@ async def test_engine():
         echo=False,
     )
 
+    # aiosqlite's implicit BEGIN handling breaks SAVEPOINT; let SQLAlchemy
+    # emit BEGIN itself so per-test transactions can be rolled back
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
     # Create all tables
     async with engine.begin() as conn:
         # Need to import all models so SQLModel knows which tables to create
@@ -59,23 +106,64 @@ async def test_session_factory(test_engine):
     return async_session
 
 
-@pytest_asyncio.fixture(scope="session")
-async def test_session(test_session_factory):
+@pytest_asyncio.fixture(scope="function")
+async def test_connection(test_engine):
     """
-    Create test database session
-    (session scope, shared across entire test session)
+    Open a connection with an outer transaction that is rolled back
+    after each test (function scope)
+    """
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
+        yield connection
+        await transaction.rollback()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_session(request, test_connection):
+    """
+    Create test database session bound to the per-test transaction
+    (function scope)
+
+    commit() only releases a SAVEPOINT, so everything written during the
+    test is discarded on teardown. API requests made while this fixture is
+    active use the same transaction, so they see the seeded data.
     """
-    async with test_session_factory() as session:
+    if request.node.get_closest_marker("no_db"):
+        pytest.fail("Tests marked no_db must not use test_session")
+
+    session_factory = sessionmaker(
+        bind=test_connection,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    async def get_test_session():
+        async with session_factory() as session:
+            yield session
+
+    previous_override = app.dependency_overrides.get(get_session)
+    app.dependency_overrides[get_session] = get_test_session
+
+    async with session_factory() as session:
         yield session
 
+    if previous_override is None:
+        app.dependency_overrides.pop(get_session, None)
+    else:
+        app.dependency_overrides[get_session] = previous_override
+
 
 @pytest_asyncio.fixture(scope="session")
 async def client(test_engine, test_session_factory):
     """
     Create FastAPI test client with test database override
+    (session scope, shared across entire test session)
 
-    This fixture overrides the database session dependency to use the test
-    database instead of the production database, ensuring test isolation.
+    Requests go straight to the app through ASGITransport, so no socket
+    or server is involved. This fixture overrides the database session
+    dependency to use the test database instead of the production
+    database, ensuring test isolation.
     """
 
     # Override get_session dependency to use test database
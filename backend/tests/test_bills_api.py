@@ -3,11 +3,8 @@ from datetime import datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import delete
 
-from app.database.models.bill import Bill
-from app.database.models.contract import Contract
-from app.database.models.customer import Customer
+from tests.conftest import seed_customers
 
 BILL_NUMBER_PATTERN = re.compile(r"^B-[A-Z]{5}-\d{2}$")
 
@@ -18,24 +15,19 @@ async def test_pending_to_active_creates_all_bills(client: AsyncClient, test_ses
     PENDING -> ACTIVE should create all draft bills.
     created_at should align with contract bill dates.
     """
-    await test_session.execute(delete(Bill))
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
-    cust = Customer(
-        customer_name="Bill API Customer",
-        invoice_title="Bill API Invoice",
-        invoice_number="BILLAPI001",
-        contact_phone="0900000000",
-        messaging_app_line="bill_api_line",
-        address="Bill API Address",
-        primary_contact="Bill API Contact",
-        customer_type="COMPANY",
+    [cust] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Bill API Customer",
+            "invoice_title": "Bill API Invoice",
+            "invoice_number": "BILLAPI001",
+            "contact_phone": "0900000000",
+            "messaging_app_line": "bill_api_line",
+            "address": "Bill API Address",
+            "primary_contact": "Bill API Contact",
+            "customer_type": "COMPANY",
+        },
     )
-    test_session.add(cust)
-    await test_session.commit()
-    await test_session.refresh(cust)
 
     start_date = datetime(2026, 1, 1, 0, 0, 0)
     end_date = datetime(2026, 12, 31, 0, 0, 0)
@@ -91,24 +83,19 @@ async def test_get_bills_within_days_prefers_due_date_else_created_at(
     """
     within_days filters on COALESCE(due_date, created_at).
     """
-    await test_session.execute(delete(Bill))
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
-    cust = Customer(
-        customer_name="Horizon Customer",
-        invoice_title="Horizon Invoice",
-        invoice_number="HORIZON001",
-        contact_phone="0912345678",
-        messaging_app_line="horizon_line",
-        address="Horizon Address",
-        primary_contact="Horizon Contact",
-        customer_type="COMPANY",
+    [cust] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Horizon Customer",
+            "invoice_title": "Horizon Invoice",
+            "invoice_number": "HORIZON001",
+            "contact_phone": "0912345678",
+            "messaging_app_line": "horizon_line",
+            "address": "Horizon Address",
+            "primary_contact": "Horizon Contact",
+            "customer_type": "COMPANY",
+        },
     )
-    test_session.add(cust)
-    await test_session.commit()
-    await test_session.refresh(cust)
 
     now = datetime.utcnow()
     start_date = now - timedelta(days=30)
@@ -6,7 +6,6 @@ from uuid import uuid4
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import delete
 
 from app.api.schemas.contract import (
     BillingInterval,
@@ -17,8 +16,8 @@ from app.api.schemas.contract import (
 )
 from app.api.schemas.customer import CustomerType
 from app.database.models.contract import Contract
-from app.database.models.customer import Customer
 from app.services.contract_service import ContractService
+from tests.conftest import seed_customers
 
 # Server-generated contract_number format: C-YYYY-MM-XXXXX (5 uppercase letters)
 CONTRACT_NUMBER_PATTERN = re.compile(r"^C-\d{4}-\d{2}-[A-Z]{5}$")
@@ -37,25 +36,21 @@ async def sample_customer(test_session):
     """
     Create a test customer for contract tests
     """
-    customer = Customer(
-        customer_name="測試客戶",
-        invoice_title="測試發票抬頭",
-        invoice_number="INV001",
-        contact_phone="0912345678",
-        messaging_app_line="line_id_1",
-        address="台北市信義區",
-        primary_contact="張三",
-        customer_type=CustomerType.COMPANY,
+    [customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "測試客戶",
+            "invoice_title": "測試發票抬頭",
+            "invoice_number": "INV001",
+            "contact_phone": "0912345678",
+            "messaging_app_line": "line_id_1",
+            "address": "台北市信義區",
+            "primary_contact": "張三",
+            "customer_type": CustomerType.COMPANY,
+        },
     )
-    test_session.add(customer)
-    await test_session.commit()
-    await test_session.refresh(customer)
 
-    yield customer
-
-    # Clean up
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
+    return customer
 
 
 @pytest.mark.asyncio
@@ -63,10 +58,6 @@ async def test_get_by_id_success(contract_service, test_session, sample_customer
     """
     Test get_by_id() successfully retrieves a contract
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     # Create a test contract
     from app.api.schemas.contract import ContractWrite
 
@@ -103,20 +94,12 @@ async def test_get_by_id_success(contract_service, test_session, sample_customer
     assert CONTRACT_NUMBER_PATTERN.match(result.contract_number)
     assert result.customer_id == sample_customer.id
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_get_by_id_not_found(contract_service, test_session):
     """
     Test get_by_id() returns None when contract doesn't exist
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     # Try to get non-existent contract
     non_existent_id = uuid4()
     result = await contract_service.get_by_id(non_existent_id)
@@ -124,10 +107,6 @@ async def test_get_by_id_not_found(contract_service, test_session):
     # Verify result is None
     assert result is None
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_get_by_id_with_none_id(contract_service):
@@ -146,9 +125,6 @@ async def test_create_with_new_billing_intervals(
     Test create() accepts new billing intervals: ONE_MONTH, TWO_MONTHS,
     TWENTY_FOUR_MONTHS, THIRTY_SIX_MONTHS.
     """
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     from app.api.schemas.contract import ContractWrite
 
     start_date = datetime.now()
@@ -181,19 +157,12 @@ async def test_create_with_new_billing_intervals(
     assert BillingInterval.TWENTY_FOUR_MONTHS in intervals
     assert BillingInterval.THIRTY_SIX_MONTHS in intervals
 
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_get_all_empty(contract_service, test_session):
     """
     Test get_all() returns empty list when database is empty
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     result = await contract_service.get_all()
 
     assert result == []
@@ -205,10 +174,6 @@ async def test_get_all_with_contracts(contract_service, test_session, sample_cus
     """
     Test get_all() returns all contracts
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     from app.api.schemas.contract import ContractWrite
 
     start_date = datetime.now()
@@ -295,47 +260,36 @@ async def test_get_all_with_contracts(contract_service, test_session, sample_cus
     assert ContractStatus.ACTIVE in statuses
     assert ContractStatus.PENDING in statuses
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_get_all_filtered_by_customer_id(contract_service, test_session):
     """
     Test get_all() with customer_id filter returns only that customer's contracts
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create customers
-    customer1 = Customer(
-        customer_name="客戶1",
-        invoice_title="發票抬頭1",
-        invoice_number="INV001",
-        contact_phone="0912345678",
-        messaging_app_line="line_id_1",
-        address="台北市信義區",
-        primary_contact="張三",
-        customer_type=CustomerType.COMPANY,
+    customer1, customer2 = await seed_customers(
+        test_session,
+        {
+            "customer_name": "客戶1",
+            "invoice_title": "發票抬頭1",
+            "invoice_number": "INV001",
+            "contact_phone": "0912345678",
+            "messaging_app_line": "line_id_1",
+            "address": "台北市信義區",
+            "primary_contact": "張三",
+            "customer_type": CustomerType.COMPANY,
+        },
+        {
+            "customer_name": "客戶2",
+            "invoice_title": "發票抬頭2",
+            "invoice_number": "INV002",
+            "contact_phone": "0923456789",
+            "messaging_app_line": "line_id_2",
+            "address": "新北市板橋區",
+            "primary_contact": "李四",
+            "customer_type": CustomerType.REAL_ESTATE,
+        },
     )
-    customer2 = Customer(
-        customer_name="客戶2",
-        invoice_title="發票抬頭2",
-        invoice_number="INV002",
-        contact_phone="0923456789",
-        messaging_app_line="line_id_2",
-        address="新北市板橋區",
-        primary_contact="李四",
-        customer_type=CustomerType.REAL_ESTATE,
-    )
-    test_session.add(customer1)
-    test_session.add(customer2)
-    await test_session.commit()
-    await test_session.refresh(customer1)
-    await test_session.refresh(customer2)
 
     from app.api.schemas.contract import ContractWrite
 
@@ -401,11 +355,6 @@ async def test_get_all_filtered_by_customer_id(contract_service, test_session):
     assert result2[0].customer_id == customer2.id
     assert result2[0].product_name == "客戶2商品1"
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_get_all_filtered_by_nonexistent_customer_id(
@@ -414,10 +363,6 @@ async def test_get_all_filtered_by_nonexistent_customer_id(
     """
     Test get_all() with non-existent customer_id returns empty list
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     # Create a contract for sample_customer
     from app.api.schemas.contract import ContractWrite
 
@@ -444,20 +389,12 @@ async def test_get_all_filtered_by_nonexistent_customer_id(
     assert result == []
     assert isinstance(result, list)
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_create_contract_success(contract_service, test_session, sample_customer):
     """
     Test create() successfully creates a contract
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     from app.api.schemas.contract import ContractWrite
 
     start_date = datetime.now()
@@ -504,10 +441,6 @@ async def test_create_contract_success(contract_service, test_session, sample_cu
     assert db_contract.product_name == "測試商品"
     assert db_contract.monthly_rent == 10000
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_create_contract_with_minimal_fields(
@@ -516,10 +449,6 @@ async def test_create_contract_with_minimal_fields(
     """
     Test create() with only required fields
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     from app.api.schemas.contract import ContractWrite
 
     start_date = datetime.now()
@@ -554,10 +483,6 @@ async def test_create_contract_with_minimal_fields(
     assert result.terminated_at is None
     assert result.termination_reason is None
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_create_contract_with_none_input(contract_service):
@@ -573,11 +498,6 @@ async def test_create_contract_invalid_customer_id(contract_service, test_sessio
     """
     Test create() returns None when customer_id doesn't exist
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     from app.api.schemas.contract import ContractWrite
 
     start_date = datetime.now()
@@ -609,21 +529,12 @@ async def test_create_contract_invalid_customer_id(contract_service, test_sessio
     db_contracts = db_result.scalars().all()
     assert len(db_contracts) == 0
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_delete_contract_success(contract_service, test_session, sample_customer):
     """
     Test delete() successfully deletes a contract
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     # Create a test contract
     from app.api.schemas.contract import ContractWrite
 
@@ -663,20 +574,12 @@ async def test_delete_contract_success(contract_service, test_session, sample_cu
     db_contract_after = db_result.scalar_one_or_none()
     assert db_contract_after is None
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_delete_contract_not_found(contract_service, test_session):
     """
     Test delete() returns False when contract doesn't exist
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     # Try to delete non-existent contract
     non_existent_id = uuid4()
     result = await contract_service.delete(non_existent_id)
@@ -684,10 +587,6 @@ async def test_delete_contract_not_found(contract_service, test_session):
     # Verify result is False
     assert result is False
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_delete_contract_with_none_id(contract_service):
@@ -703,10 +602,6 @@ async def test_update_contract_success(contract_service, test_session, sample_cu
     """
     Test update() successfully updates a contract
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     # Create a test contract
     from app.api.schemas.contract import ContractWrite
 
@@ -766,10 +661,6 @@ async def test_update_contract_success(contract_service, test_session, sample_cu
     assert db_contract.status == ContractStatus.PENDING
     assert db_contract.payment_method == PaymentMethod.CASH
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_update_contract_partial_update(
@@ -778,10 +669,6 @@ async def test_update_contract_partial_update(
     """
     Test update() with partial update only updates specified fields
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     # Create a test contract
     start_date = datetime.now()
     end_date = start_date + timedelta(days=365)
@@ -817,20 +704,12 @@ async def test_update_contract_partial_update(
     assert result.payment_method == original_payment_method
     assert result.notes == "Original Notes"
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_update_contract_not_found(contract_service, test_session):
     """
     Test update() raises ValueError when contract doesn't exist
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     from app.api.schemas.contract import ContractUpdate
 
     # Try to update non-existent contract
@@ -843,10 +722,6 @@ async def test_update_contract_not_found(contract_service, test_session):
     assert "not found" in str(exc_info.value).lower()
     assert str(non_existent_id) in str(exc_info.value)
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_update_contract_with_termination(
@@ -855,10 +730,6 @@ async def test_update_contract_with_termination(
     """
     Test update() can set termination fields
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     # Create a test contract
     start_date = datetime.now()
     end_date = start_date + timedelta(days=365)
@@ -891,7 +762,3 @@ async def test_update_contract_with_termination(
     assert result.status == ContractStatus.TERMINATED
     assert result.terminated_at is not None
     assert result.termination_reason == "Contract terminated by customer request"
-
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
@@ -6,12 +6,11 @@ from uuid import UUID, uuid4
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import delete, select
+from sqlalchemy import select
 
 from app.api.schemas.customer import CustomerType
-from app.database.models.bill import Bill
 from app.database.models.contract import Contract
-from app.database.models.customer import Customer
+from tests.conftest import seed_customers
 
 # Server-generated contract_number format: C-YYYY-MM-XXXXX (5 uppercase letters)
 CONTRACT_NUMBER_PATTERN = re.compile(r"^C-\d{4}-\d{2}-[A-Z]{5}$")
@@ -22,26 +21,20 @@ async def test_get_contract_by_id_success(client: AsyncClient, test_session):
     """
     Test GET /api/v1/contracts/{contract_id} returns contract when found
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Bill))
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create a customer first
-    test_customer = Customer(
-        customer_name="Get ID Test Customer",
-        invoice_title="Get ID Invoice",
-        invoice_number="GET001",
-        contact_phone="0966666666",
-        messaging_app_line="get_id_test_line",
-        address="Get ID Test Address",
-        primary_contact="Get ID Contact",
-        customer_type=CustomerType.COMPANY,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Get ID Test Customer",
+            "invoice_title": "Get ID Invoice",
+            "invoice_number": "GET001",
+            "contact_phone": "0966666666",
+            "messaging_app_line": "get_id_test_line",
+            "address": "Get ID Test Address",
+            "primary_contact": "Get ID Contact",
+            "customer_type": CustomerType.COMPANY,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
 
     # Create a contract via API
     start_date = datetime.now()
@@ -81,11 +74,6 @@ async def test_get_contract_by_id_success(client: AsyncClient, test_session):
     assert contract["created_at"] is not None
     assert contract["updated_at"] is not None
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_get_contract_by_id_not_found(client: AsyncClient, test_session):
@@ -93,10 +81,6 @@ async def test_get_contract_by_id_not_found(client: AsyncClient, test_session):
     Test GET /api/v1/contracts/{contract_id} returns 404
     when contract not found
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     # Try to get non-existent contract
     non_existent_id = str(uuid4())
     response = await client.get(f"/api/v1/contracts/{non_existent_id}")
@@ -106,12 +90,9 @@ async def test_get_contract_by_id_not_found(client: AsyncClient, test_session):
     assert non_existent_id in error_detail["detail"]
     assert "not found" in error_detail["detail"].lower()
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
+@pytest.mark.no_db
 async def test_get_contract_by_id_invalid_uuid(client: AsyncClient):
     """
     Test GET /api/v1/contracts/{contract_id} returns 422
@@ -130,26 +111,20 @@ async def test_create_contract_via_api(client: AsyncClient, test_session):
     """
     Test POST /api/v1/contracts/ creates a contract in the test database
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Bill))
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create a customer first
-    test_customer = Customer(
-        customer_name="API Test Customer",
-        invoice_title="API Test Invoice",
-        invoice_number="API001",
-        contact_phone="0911111111",
-        messaging_app_line="api_test_line",
-        address="Test Address",
-        primary_contact="Test Contact",
-        customer_type=CustomerType.COMPANY,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "API Test Customer",
+            "invoice_title": "API Test Invoice",
+            "invoice_number": "API001",
+            "contact_phone": "0911111111",
+            "messaging_app_line": "api_test_line",
+            "address": "Test Address",
+            "primary_contact": "Test Contact",
+            "customer_type": CustomerType.COMPANY,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
 
     # Create contract via API
     start_date = datetime.now()
@@ -198,22 +173,12 @@ async def test_create_contract_via_api(client: AsyncClient, test_session):
     assert db_contract.monthly_rent == 15000
     assert db_contract.customer_id == test_customer.id
 
-    # Cleanup
-    await test_session.execute(delete(Bill))
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_get_contracts_empty(client: AsyncClient, test_session):
     """
     Test GET /api/v1/contracts/ returns empty list when database is empty
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     response = await client.get("/api/v1/contracts/")
     assert response.status_code == 200
     data = response.json()
@@ -225,37 +190,30 @@ async def test_get_contracts_with_data(client: AsyncClient, test_session):
     """
     Test GET /api/v1/contracts/ returns all contracts from test database
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create test customers
-    test_customer1 = Customer(
-        customer_name="Get All Customer 1",
-        invoice_title="Get All Invoice 1",
-        invoice_number="GETALL001",
-        contact_phone="0977777777",
-        messaging_app_line="getall_test_line1",
-        address="Get All Address 1",
-        primary_contact="Get All Contact 1",
-        customer_type=CustomerType.COMPANY,
-    )
-    test_customer2 = Customer(
-        customer_name="Get All Customer 2",
-        invoice_title="Get All Invoice 2",
-        invoice_number="GETALL002",
-        contact_phone="0988888888",
-        messaging_app_line="getall_test_line2",
-        address="Get All Address 2",
-        primary_contact="Get All Contact 2",
-        customer_type=CustomerType.EDUCATION,
+    test_customer1, test_customer2 = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Get All Customer 1",
+            "invoice_title": "Get All Invoice 1",
+            "invoice_number": "GETALL001",
+            "contact_phone": "0977777777",
+            "messaging_app_line": "getall_test_line1",
+            "address": "Get All Address 1",
+            "primary_contact": "Get All Contact 1",
+            "customer_type": CustomerType.COMPANY,
+        },
+        {
+            "customer_name": "Get All Customer 2",
+            "invoice_title": "Get All Invoice 2",
+            "invoice_number": "GETALL002",
+            "contact_phone": "0988888888",
+            "messaging_app_line": "getall_test_line2",
+            "address": "Get All Address 2",
+            "primary_contact": "Get All Contact 2",
+            "customer_type": CustomerType.EDUCATION,
+        },
     )
-    test_session.add(test_customer1)
-    test_session.add(test_customer2)
-    await test_session.commit()
-    await test_session.refresh(test_customer1)
-    await test_session.refresh(test_customer2)
 
     # Create contracts via API
     start_date = datetime.now()
@@ -309,48 +267,36 @@ async def test_get_contracts_with_data(client: AsyncClient, test_session):
     assert "Get All Product 2" in product_names
     assert "Get All Product 3" in product_names
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_get_contracts_filtered_by_customer_id(client: AsyncClient, test_session):
     """
     Test GET /api/v1/contracts/?customer_id={uuid} returns only that customer's contracts
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create test customers
-    test_customer1 = Customer(
-        customer_name="Filter Customer 1",
-        invoice_title="Filter Invoice 1",
-        invoice_number="FILTER001",
-        contact_phone="0999999999",
-        messaging_app_line="filter_test_line1",
-        address="Filter Address 1",
-        primary_contact="Filter Contact 1",
-        customer_type=CustomerType.COMPANY,
+    test_customer1, test_customer2 = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Filter Customer 1",
+            "invoice_title": "Filter Invoice 1",
+            "invoice_number": "FILTER001",
+            "contact_phone": "0999999999",
+            "messaging_app_line": "filter_test_line1",
+            "address": "Filter Address 1",
+            "primary_contact": "Filter Contact 1",
+            "customer_type": CustomerType.COMPANY,
+        },
+        {
+            "customer_name": "Filter Customer 2",
+            "invoice_title": "Filter Invoice 2",
+            "invoice_number": "FILTER002",
+            "contact_phone": "0900000000",
+            "messaging_app_line": "filter_test_line2",
+            "address": "Filter Address 2",
+            "primary_contact": "Filter Contact 2",
+            "customer_type": CustomerType.REAL_ESTATE,
+        },
     )
-    test_customer2 = Customer(
-        customer_name="Filter Customer 2",
-        invoice_title="Filter Invoice 2",
-        invoice_number="FILTER002",
-        contact_phone="0900000000",
-        messaging_app_line="filter_test_line2",
-        address="Filter Address 2",
-        primary_contact="Filter Contact 2",
-        customer_type=CustomerType.REAL_ESTATE,
-    )
-    test_session.add(test_customer1)
-    test_session.add(test_customer2)
-    await test_session.commit()
-    await test_session.refresh(test_customer1)
-    await test_session.refresh(test_customer2)
 
     # Create contracts via API
     start_date = datetime.now()
@@ -419,11 +365,6 @@ async def test_get_contracts_filtered_by_customer_id(client: AsyncClient, test_s
     assert contracts2[0]["customer_id"] == str(test_customer2.id)
     assert contracts2[0]["product_name"] == "Filter Product 3"
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_get_contracts_with_nonexistent_customer_id(
@@ -433,25 +374,20 @@ async def test_get_contracts_with_nonexistent_customer_id(
     Test GET /api/v1/contracts/?customer_id={uuid} returns empty list
     when customer has no contracts
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create a customer
-    test_customer = Customer(
-        customer_name="No Contracts Customer",
-        invoice_title="No Contracts Invoice",
-        invoice_number="NOCON001",
-        contact_phone="0911111111",
-        messaging_app_line="nocontracts_test_line",
-        address="No Contracts Address",
-        primary_contact="No Contracts Contact",
-        customer_type=CustomerType.COMPANY,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "No Contracts Customer",
+            "invoice_title": "No Contracts Invoice",
+            "invoice_number": "NOCON001",
+            "contact_phone": "0911111111",
+            "messaging_app_line": "nocontracts_test_line",
+            "address": "No Contracts Address",
+            "primary_contact": "No Contracts Contact",
+            "customer_type": CustomerType.COMPANY,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
 
     # Try to get contracts for customer with no contracts
     response = await client.get(f"/api/v1/contracts/?customer_id={test_customer.id}")
@@ -461,36 +397,26 @@ async def test_get_contracts_with_nonexistent_customer_id(
     # Verify empty list is returned
     assert contracts == []
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_create_contract_with_minimal_fields(client: AsyncClient, test_session):
     """
     Test POST /api/v1/contracts/ creates a contract with only required fields
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create a customer first
-    test_customer = Customer(
-        customer_name="Minimal Test Customer",
-        invoice_title="Minimal Invoice",
-        invoice_number="MIN001",
-        contact_phone="0922222222",
-        messaging_app_line="minimal_line",
-        address="Minimal Address",
-        primary_contact="Minimal Contact",
-        customer_type=CustomerType.EDUCATION,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Minimal Test Customer",
+            "invoice_title": "Minimal Invoice",
+            "invoice_number": "MIN001",
+            "contact_phone": "0922222222",
+            "messaging_app_line": "minimal_line",
+            "address": "Minimal Address",
+            "primary_contact": "Minimal Contact",
+            "customer_type": CustomerType.EDUCATION,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
 
     # Create contract with minimal fields via API
     start_date = datetime.now()
@@ -524,13 +450,9 @@ async def test_create_contract_with_minimal_fields(client: AsyncClient, test_ses
     assert created_contract["terminated_at"] is None
     assert created_contract["termination_reason"] is None
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
+@pytest.mark.no_db
 async def test_create_contract_missing_required_fields(client: AsyncClient):
     """
     Test POST /api/v1/contracts/ returns 422 when required fields are missing
@@ -579,25 +501,20 @@ async def test_create_contract_invalid_billing_interval(
     """
     Test POST /api/v1/contracts/ returns 422 for invalid billing_interval
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create a customer first
-    test_customer = Customer(
-        customer_name="Invalid Test Customer",
-        invoice_title="Invalid Invoice",
-        invoice_number="INV001",
-        contact_phone="0933333333",
-        messaging_app_line="invalid_line",
-        address="Invalid Address",
-        primary_contact="Invalid Contact",
-        customer_type=CustomerType.COMPANY,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Invalid Test Customer",
+            "invoice_title": "Invalid Invoice",
+            "invoice_number": "INV001",
+            "contact_phone": "0933333333",
+            "messaging_app_line": "invalid_line",
+            "address": "Invalid Address",
+            "primary_contact": "Invalid Contact",
+            "customer_type": CustomerType.COMPANY,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
 
     start_date = datetime.now()
     end_date = start_date + timedelta(days=365)
@@ -617,11 +534,6 @@ async def test_create_contract_invalid_billing_interval(
     error_detail = response.json()
     assert "detail" in error_detail
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_create_contract_with_new_billing_intervals(
@@ -630,23 +542,19 @@ async def test_create_contract_with_new_billing_intervals(
     """
     Test POST /api/v1/contracts/ accepts new billing_interval values: 1, 2, 24, 36.
     """
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
-    test_customer = Customer(
-        customer_name="New Interval Customer",
-        invoice_title="New Interval Invoice",
-        invoice_number="INV002",
-        contact_phone="0944444444",
-        messaging_app_line="new_interval_line",
-        address="New Interval Address",
-        primary_contact="New Contact",
-        customer_type=CustomerType.COMPANY,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "New Interval Customer",
+            "invoice_title": "New Interval Invoice",
+            "invoice_number": "INV002",
+            "contact_phone": "0944444444",
+            "messaging_app_line": "new_interval_line",
+            "address": "New Interval Address",
+            "primary_contact": "New Contact",
+            "customer_type": CustomerType.COMPANY,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
 
     start_date = datetime.now()
     end_date = start_date + timedelta(days=365)
@@ -666,35 +574,26 @@ async def test_create_contract_with_new_billing_intervals(
         created = response.json()
         assert created["billing_interval"] == billing_interval
 
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_create_contract_product_name_too_long(client: AsyncClient, test_session):
     """
     Test POST /api/v1/contracts/ returns 422 when product_name exceeds 30 characters
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create a customer first
-    test_customer = Customer(
-        customer_name="Long Name Test Customer",
-        invoice_title="Long Name Invoice",
-        invoice_number="LONG001",
-        contact_phone="0944444444",
-        messaging_app_line="long_name_line",
-        address="Long Name Address",
-        primary_contact="Long Name Contact",
-        customer_type=CustomerType.COMPANY,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Long Name Test Customer",
+            "invoice_title": "Long Name Invoice",
+            "invoice_number": "LONG001",
+            "contact_phone": "0944444444",
+            "messaging_app_line": "long_name_line",
+            "address": "Long Name Address",
+            "primary_contact": "Long Name Contact",
+            "customer_type": CustomerType.COMPANY,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
 
     start_date = datetime.now()
     end_date = start_date + timedelta(days=365)
@@ -714,11 +613,6 @@ async def test_create_contract_product_name_too_long(client: AsyncClient, test_s
     error_detail = response.json()
     assert "detail" in error_detail
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_delete_contract_success(client: AsyncClient, test_session):
@@ -726,25 +620,20 @@ async def test_delete_contract_success(client: AsyncClient, test_session):
     Test DELETE /api/v1/contracts/{contract_id} successfully deletes
     an existing contract
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create a customer first
-    test_customer = Customer(
-        customer_name="Delete Test Customer",
-        invoice_title="Delete Invoice",
-        invoice_number="DEL001",
-        contact_phone="0955555555",
-        messaging_app_line="delete_test_line",
-        address="Delete Test Address",
-        primary_contact="Delete Contact",
-        customer_type=CustomerType.COMPANY,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Delete Test Customer",
+            "invoice_title": "Delete Invoice",
+            "invoice_number": "DEL001",
+            "contact_phone": "0955555555",
+            "messaging_app_line": "delete_test_line",
+            "address": "Delete Test Address",
+            "primary_contact": "Delete Contact",
+            "customer_type": CustomerType.COMPANY,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
 
     # Create a contract via API
     start_date = datetime.now()
@@ -784,11 +673,6 @@ async def test_delete_contract_success(client: AsyncClient, test_session):
     db_contract_after = result.scalar_one_or_none()
     assert db_contract_after is None
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_delete_contract_not_found(client: AsyncClient, test_session):
@@ -796,10 +680,6 @@ async def test_delete_contract_not_found(client: AsyncClient, test_session):
     Test DELETE /api/v1/contracts/{contract_id} returns 404
     when contract not found
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     # Try to delete non-existent contract
     non_existent_id = str(uuid4())
     response = await client.delete(f"/api/v1/contracts/{non_existent_id}")
@@ -808,12 +688,9 @@ async def test_delete_contract_not_found(client: AsyncClient, test_session):
     assert "detail" in error_detail
     assert non_existent_id in error_detail["detail"]
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
+@pytest.mark.no_db
 async def test_delete_contract_invalid_uuid(client: AsyncClient):
     """
     Test DELETE /api/v1/contracts/{contract_id} returns 422
@@ -833,25 +710,20 @@ async def test_update_contract_success(client: AsyncClient, test_session):
     Test PATCH /api/v1/contracts/{contract_id} successfully updates
     an existing contract
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create a customer first
-    test_customer = Customer(
-        customer_name="Update Test Customer",
-        invoice_title="Update Invoice",
-        invoice_number="UPD001",
-        contact_phone="0999999999",
-        messaging_app_line="update_test_line",
-        address="Update Test Address",
-        primary_contact="Update Contact",
-        customer_type=CustomerType.COMPANY,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Update Test Customer",
+            "invoice_title": "Update Invoice",
+            "invoice_number": "UPD001",
+            "contact_phone": "0999999999",
+            "messaging_app_line": "update_test_line",
+            "address": "Update Test Address",
+            "primary_contact": "Update Contact",
+            "customer_type": CustomerType.COMPANY,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
 
     # Create a contract via API
     start_date = datetime.now()
@@ -909,11 +781,6 @@ async def test_update_contract_success(client: AsyncClient, test_session):
     assert db_contract.status.value == "PENDING"
     assert db_contract.payment_method.value == "CASH"
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_update_contract_partial_update(client: AsyncClient, test_session):
@@ -921,25 +788,20 @@ async def test_update_contract_partial_update(client: AsyncClient, test_session)
     Test PATCH /api/v1/contracts/{contract_id} successfully updates
     only specified fields
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create a customer first
-    test_customer = Customer(
-        customer_name="Partial Update Customer",
-        invoice_title="Partial Update Invoice",
-        invoice_number="PART001",
-        contact_phone="0888888888",
-        messaging_app_line="partial_update_test_line",
-        address="Partial Update Address",
-        primary_contact="Partial Update Contact",
-        customer_type=CustomerType.EDUCATION,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Partial Update Customer",
+            "invoice_title": "Partial Update Invoice",
+            "invoice_number": "PART001",
+            "contact_phone": "0888888888",
+            "messaging_app_line": "partial_update_test_line",
+            "address": "Partial Update Address",
+            "primary_contact": "Partial Update Contact",
+            "customer_type": CustomerType.EDUCATION,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
 
     # Create a contract via API
     start_date = datetime.now()
@@ -979,11 +841,6 @@ async def test_update_contract_partial_update(client: AsyncClient, test_session)
     assert updated_contract["payment_method"] == original_payment_method
     assert updated_contract["notes"] == "Original Notes"
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_update_contract_not_found(client: AsyncClient, test_session):
@@ -991,10 +848,6 @@ async def test_update_contract_not_found(client: AsyncClient, test_session):
     Test PATCH /api/v1/contracts/{contract_id} returns 404
     when contract not found
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
     # Try to update non-existent contract
     non_existent_id = str(uuid4())
     update_data = {
@@ -1010,35 +863,26 @@ async def test_update_contract_not_found(client: AsyncClient, test_session):
     assert non_existent_id in error_detail["detail"]
     assert "not found" in error_detail["detail"].lower()
 
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_update_contract_with_termination(client: AsyncClient, test_session):
     """
     Test PATCH /api/v1/contracts/{contract_id} can set termination fields
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create a customer first
-    test_customer = Customer(
-        customer_name="Termination Test Customer",
-        invoice_title="Termination Invoice",
-        invoice_number="TERM001",
-        contact_phone="0777777777",
-        messaging_app_line="termination_test_line",
-        address="Termination Address",
-        primary_contact="Termination Contact",
-        customer_type=CustomerType.COMPANY,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Termination Test Customer",
+            "invoice_title": "Termination Invoice",
+            "invoice_number": "TERM001",
+            "contact_phone": "0777777777",
+            "messaging_app_line": "termination_test_line",
+            "address": "Termination Address",
+            "primary_contact": "Termination Contact",
+            "customer_type": CustomerType.COMPANY,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
 
     # Create a contract via API
     start_date = datetime.now()
@@ -1078,8 +922,3 @@ async def test_update_contract_with_termination(client: AsyncClient, test_sessio
         updated_contract["termination_reason"]
         == "Contract terminated by customer request"
     )
-
-    # Cleanup
-    await test_session.execute(delete(Contract))
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
@@ -2,10 +2,11 @@ from uuid import UUID, uuid4
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import delete, select
+from sqlalchemy import select
 
 from app.api.schemas.customer import CustomerType
 from app.database.models.customer import Customer
+from tests.conftest import seed_customers
 
 
 @pytest.mark.asyncio
@@ -14,10 +15,6 @@ async def test_get_customers_empty(client: AsyncClient, test_session):
     Test GET /api/v1/customers/ returns empty list when database is empty
     This verifies that the API endpoint uses the test database.
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     response = await client.get("/api/v1/customers/")
     assert response.status_code == 200
     data = response.json()
@@ -30,10 +27,6 @@ async def test_create_customer_via_api(client: AsyncClient, test_session):
     Test POST /api/v1/customers/ creates a customer in the test database
     This verifies that the API endpoint uses the test database, not production.
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create customer via API
     customer_data = {
         "customer_name": "API Test Customer",
@@ -58,105 +51,101 @@ async def test_create_customer_via_api(client: AsyncClient, test_session):
     # Verify customer exists in test database
     # Convert string ID to UUID object
     customer_id = UUID(created_customer["id"])
-    result = await test_session.execute(
-        select(Customer).where(
-            Customer.id == customer_id  # type: ignore[arg-type]
+    db_customer = (
+        await test_session.scalars(
+            select(Customer).where(
+                Customer.id == customer_id  # type: ignore[arg-type]
+            )
         )
-    )
-    db_customer = result.scalar_one_or_none()
+    ).one_or_none()
     assert db_customer is not None
     assert db_customer.customer_name == "API Test Customer"
     assert db_customer.invoice_number == "API001"
 
-    # Cleanup
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
-async def test_get_customers_with_data(client: AsyncClient, test_session):
+@pytest.mark.parametrize("customer_type", list(CustomerType))
+async def test_customer_roundtrip(
+    client: AsyncClient, test_session, customer_type: CustomerType
+):
     """
-    Test GET /api/v1/customers/ returns customers from test database
+    Test a customer of every customer_type can be listed, fetched by ID
+    and partially updated via the API
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create test customer directly in test database
-    test_customer = Customer(
-        customer_name="Direct DB Customer",
-        invoice_title="Direct DB Invoice",
-        invoice_number="DB001",
-        contact_phone="0922222222",
-        messaging_app_line="db_test_line",
-        address="DB Test Address",
-        primary_contact="DB Contact",
-        customer_type=CustomerType.EDUCATION,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Roundtrip Customer",
+            "invoice_title": "Roundtrip Invoice Title",
+            "invoice_number": "RT001",
+            "contact_phone": "0922222222",
+            "messaging_app_line": "roundtrip_line",
+            "address": "Roundtrip Address",
+            "primary_contact": "Roundtrip Contact",
+            "customer_type": customer_type,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
+    customer_id = str(test_customer.id)
 
-    # Get customers via API
+    # GET /api/v1/customers/ returns the customer we created directly in test DB
     response = await client.get("/api/v1/customers/")
     assert response.status_code == 200
     customers = response.json()
-
-    # Verify API returns the customer we created directly in test DB
     assert len(customers) == 1
-    assert customers[0]["customer_name"] == "Direct DB Customer"
-    assert customers[0]["invoice_number"] == "DB001"
-    assert customers[0]["id"] == str(test_customer.id)
-
-    # Cleanup
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
-
-@pytest.mark.asyncio
-async def test_get_customer_by_id_success(client: AsyncClient, test_session):
-    """
-    Test GET /api/v1/customers/{customer_id} returns customer when found
-    """
-    # Ensure database is empty
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
-    # Create test customer directly in test database
-    test_customer = Customer(
-        customer_name="Test Customer for ID",
-        invoice_title="Test Invoice Title",
-        invoice_number="ID001",
-        contact_phone="0933333333",
-        messaging_app_line="id_test_line",
-        address="ID Test Address",
-        primary_contact="ID Contact",
-        customer_type=CustomerType.COMPANY,
-    )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
+    assert customers[0]["id"] == customer_id
+    assert customers[0]["customer_name"] == "Roundtrip Customer"
+    assert customers[0]["invoice_number"] == "RT001"
+    assert customers[0]["customer_type"] == customer_type.value
 
-    # Get customer by ID via API
-    customer_id = str(test_customer.id)
+    # GET /api/v1/customers/{customer_id} returns all fields
     response = await client.get(f"/api/v1/customers/{customer_id}")
     assert response.status_code == 200
     customer = response.json()
-
-    # Verify response data
     assert customer["id"] == customer_id
-    assert customer["customer_name"] == "Test Customer for ID"
-    assert customer["invoice_title"] == "Test Invoice Title"
-    assert customer["invoice_number"] == "ID001"
-    assert customer["contact_phone"] == "0933333333"
-    assert customer["messaging_app_line"] == "id_test_line"
-    assert customer["address"] == "ID Test Address"
-    assert customer["primary_contact"] == "ID Contact"
-    assert customer["customer_type"] == "COMPANY"
+    assert customer["customer_name"] == "Roundtrip Customer"
+    assert customer["invoice_title"] == "Roundtrip Invoice Title"
+    assert customer["invoice_number"] == "RT001"
+    assert customer["contact_phone"] == "0922222222"
+    assert customer["messaging_app_line"] == "roundtrip_line"
+    assert customer["address"] == "Roundtrip Address"
+    assert customer["primary_contact"] == "Roundtrip Contact"
+    assert customer["customer_type"] == customer_type.value
+
+    # PATCH /api/v1/customers/{customer_id} updates only specified fields
+    update_data = {
+        "customer_name": "Partially Updated Name",
+        "invoice_title": "Partially Updated Invoice Title",
+        "address": "Partially Updated Address",
+    }
+    response = await client.patch(f"/api/v1/customers/{customer_id}", json=update_data)  # noqa: E501
+    assert response.status_code == 200
+    updated_customer = response.json()
+    assert updated_customer["id"] == customer_id
+    assert updated_customer["customer_name"] == "Partially Updated Name"
+    assert updated_customer["invoice_title"] == "Partially Updated Invoice Title"  # noqa: E501
+    assert updated_customer["address"] == "Partially Updated Address"
+    assert updated_customer["invoice_number"] == "RT001"
+    assert updated_customer["contact_phone"] == "0922222222"
+    assert updated_customer["customer_type"] == customer_type.value
 
-    # Cleanup
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
+    # Verify customer was partially updated in database
+    # Remove the object from session to force fresh query from database
+    test_session.expunge(test_customer)
+    db_customer = (
+        await test_session.scalars(
+            select(Customer).where(
+                Customer.id == test_customer.id  # type: ignore[arg-type]
+            )
+        )
+    ).one_or_none()
+    assert db_customer is not None
+    assert db_customer.customer_name == "Partially Updated Name"
+    assert db_customer.invoice_title == "Partially Updated Invoice Title"
+    assert db_customer.address == "Partially Updated Address"
+    assert db_customer.invoice_number == "RT001"
+    assert db_customer.contact_phone == "0922222222"
+    assert db_customer.customer_type == customer_type
 
 
 @pytest.mark.asyncio
@@ -165,10 +154,6 @@ async def test_get_customer_by_id_not_found(client: AsyncClient, test_session):
     Test GET /api/v1/customers/{customer_id} returns 404
     when customer not found
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Try to get non-existent customer
     non_existent_id = str(uuid4())
     response = await client.get(f"/api/v1/customers/{non_existent_id}")
@@ -180,6 +165,7 @@ async def test_get_customer_by_id_not_found(client: AsyncClient, test_session):
 
 
 @pytest.mark.asyncio
+@pytest.mark.no_db
 async def test_get_customer_by_id_invalid_uuid(client: AsyncClient):
     """
     Test GET /api/v1/customers/{customer_id} returns 422
@@ -199,10 +185,6 @@ async def test_delete_customer_not_found(client: AsyncClient, test_session):
     Test DELETE /api/v1/customers/{customer_id} returns 404
     when customer not found
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Try to delete non-existent customer
     non_existent_id = str(uuid4())
     response = await client.delete(f"/api/v1/customers/{non_existent_id}")
@@ -219,34 +201,31 @@ async def test_delete_customer_success(client: AsyncClient, test_session):
     Test DELETE /api/v1/customers/{customer_id} successfully deletes
     an existing customer
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create test customer directly in test database
-    test_customer = Customer(
-        customer_name="Customer to Delete",
-        invoice_title="Delete Invoice Title",
-        invoice_number="DEL001",
-        contact_phone="0944444444",
-        messaging_app_line="del_test_line",
-        address="Delete Test Address",
-        primary_contact="Delete Contact",
-        customer_type=CustomerType.COMPANY,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Customer to Delete",
+            "invoice_title": "Delete Invoice Title",
+            "invoice_number": "DEL001",
+            "contact_phone": "0944444444",
+            "messaging_app_line": "del_test_line",
+            "address": "Delete Test Address",
+            "primary_contact": "Delete Contact",
+            "customer_type": CustomerType.COMPANY,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
 
     customer_id = str(test_customer.id)
 
     # Verify customer exists before deletion
-    result = await test_session.execute(
-        select(Customer).where(
-            Customer.id == test_customer.id  # type: ignore[arg-type]
+    db_customer_before = (
+        await test_session.scalars(
+            select(Customer).where(
+                Customer.id == test_customer.id  # type: ignore[arg-type]
+            )
         )
-    )
-    db_customer_before = result.scalar_one_or_none()
+    ).one_or_none()
     assert db_customer_before is not None
     assert db_customer_before.customer_name == "Customer to Delete"
 
@@ -255,18 +234,15 @@ async def test_delete_customer_success(client: AsyncClient, test_session):
     assert response.status_code == 204
 
     # Verify customer no longer exists in database
-    result = await test_session.execute(
-        select(Customer).where(
-            Customer.id == test_customer.id  # type: ignore[arg-type]
+    db_customer_after = (
+        await test_session.scalars(
+            select(Customer).where(
+                Customer.id == test_customer.id  # type: ignore[arg-type]
+            )
         )
-    )
-    db_customer_after = result.scalar_one_or_none()
+    ).one_or_none()
     assert db_customer_after is None
 
-    # Cleanup (should be empty already, but just in case)
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_update_customer_not_found(client: AsyncClient, test_session):
@@ -274,10 +250,6 @@ async def test_update_customer_not_found(client: AsyncClient, test_session):
     Test PATCH /api/v1/customers/{customer_id} returns 404
     when customer not found
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Try to update non-existent customer
     non_existent_id = str(uuid4())
     update_data = {
@@ -299,24 +271,20 @@ async def test_update_customer_full_update(client: AsyncClient, test_session):
     Test PATCH /api/v1/customers/{customer_id} successfully updates
     all fields of an existing customer
     """
-    # Ensure database is empty
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
     # Create test customer directly in test database
-    test_customer = Customer(
-        customer_name="Original Name",
-        invoice_title="Original Invoice Title",
-        invoice_number="ORIG001",
-        contact_phone="0955555555",
-        messaging_app_line="original_line",
-        address="Original Address",
-        primary_contact="Original Contact",
-        customer_type=CustomerType.COMPANY,
+    [test_customer] = await seed_customers(
+        test_session,
+        {
+            "customer_name": "Original Name",
+            "invoice_title": "Original Invoice Title",
+            "invoice_number": "ORIG001",
+            "contact_phone": "0955555555",
+            "messaging_app_line": "original_line",
+            "address": "Original Address",
+            "primary_contact": "Original Contact",
+            "customer_type": CustomerType.COMPANY,
+        },
     )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
 
     customer_id = str(test_customer.id)
 
@@ -350,12 +318,13 @@ async def test_update_customer_full_update(client: AsyncClient, test_session):
     # Verify customer was updated in database
     # Remove the object from session to force fresh query from database
     test_session.expunge(test_customer)
-    result = await test_session.execute(
-        select(Customer).where(
-            Customer.id == test_customer.id  # type: ignore[arg-type]
+    db_customer = (
+        await test_session.scalars(
+            select(Customer).where(
+                Customer.id == test_customer.id  # type: ignore[arg-type]
+            )
         )
-    )
-    db_customer = result.scalar_one_or_none()
+    ).one_or_none()
     assert db_customer is not None
     assert db_customer.customer_name == "Updated Full Name"
     assert db_customer.invoice_title == "Updated Invoice Title"
@@ -365,82 +334,3 @@ async def test_update_customer_full_update(client: AsyncClient, test_session):
     assert db_customer.address == "Updated Address"
     assert db_customer.primary_contact == "Updated Contact"
     assert db_customer.customer_type == CustomerType.EDUCATION
-
-    # Cleanup
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
-
-@pytest.mark.asyncio
-async def test_update_customer_partial_update(client: AsyncClient, test_session):  # noqa: E501
-    """
-    Test PATCH /api/v1/customers/{customer_id} successfully updates
-    only specified fields of an existing customer
-    """
-    # Ensure database is empty
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
-
-    # Create test customer directly in test database
-    test_customer = Customer(
-        customer_name="Original Name",
-        invoice_title="Original Invoice Title",
-        invoice_number="ORIG002",
-        contact_phone="0977777777",
-        messaging_app_line="original_line",
-        address="Original Address",
-        primary_contact="Original Contact",
-        customer_type=CustomerType.REAL_ESTATE,
-    )
-    test_session.add(test_customer)
-    await test_session.commit()
-    await test_session.refresh(test_customer)
-
-    customer_id = str(test_customer.id)
-    original_invoice_number = test_customer.invoice_number
-    original_contact_phone = test_customer.contact_phone
-    original_customer_type = test_customer.customer_type
-
-    # Update only some fields via API
-    update_data = {
-        "customer_name": "Partially Updated Name",
-        "invoice_title": "Partially Updated Invoice Title",
-        "address": "Partially Updated Address",
-    }
-
-    response = await client.patch(f"/api/v1/customers/{customer_id}", json=update_data)  # noqa: E501
-    assert response.status_code == 200
-    updated_customer = response.json()
-
-    # Verify updated fields in response
-    assert updated_customer["id"] == customer_id
-    assert updated_customer["customer_name"] == "Partially Updated Name"
-    assert updated_customer["invoice_title"] == "Partially Updated Invoice Title"  # noqa: E501
-    assert updated_customer["address"] == "Partially Updated Address"
-
-    # Verify unchanged fields in response
-    assert updated_customer["invoice_number"] == original_invoice_number
-    assert updated_customer["contact_phone"] == original_contact_phone
-    assert updated_customer["customer_type"] == original_customer_type.value
-
-    # Verify customer was partially updated in database
-    # Remove the object from session to force fresh query from database
-    test_session.expunge(test_customer)
-    result = await test_session.execute(
-        select(Customer).where(
-            Customer.id == test_customer.id  # type: ignore[arg-type]
-        )
-    )
-    db_customer = result.scalar_one_or_none()
-    assert db_customer is not None
-    assert db_customer.customer_name == "Partially Updated Name"
-    assert db_customer.invoice_title == "Partially Updated Invoice Title"
-    assert db_customer.address == "Partially Updated Address"
-    # Verify unchanged fields
-    assert db_customer.invoice_number == original_invoice_number
-    assert db_customer.contact_phone == original_contact_phone
-    assert db_customer.customer_type == original_customer_type
-
-    # Cleanup
-    await test_session.execute(delete(Customer))
-    await test_session.commit()
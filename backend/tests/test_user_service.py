@@ -1,6 +1,6 @@
 import pytest
 import pytest_asyncio
-from sqlalchemy import delete, select
+from sqlalchemy import select
 
 from app.api.schemas.user import UserCreate, UserType
 from app.core.security import pwd_context
@@ -21,10 +21,6 @@ async def test_create_user_success(user_service, test_session):
     """
     Test create() successfully creates a user
     """
-    # Ensure database is empty
-    await test_session.execute(delete(User))
-    await test_session.commit()
-
     # Create user data
     user_data = UserCreate(
         name="張培堯",
@@ -54,8 +50,7 @@ async def test_create_user_success(user_service, test_session):
 
     # Verify user exists in database
     statement = select(User).where(User.id == result.id)
-    db_result = await test_session.execute(statement)
-    db_user = db_result.scalar_one_or_none()
+    db_user = (await test_session.scalars(statement)).one_or_none()
 
     assert db_user is not None
     assert db_user.name == "張培堯"
@@ -70,10 +65,6 @@ async def test_create_user_success(user_service, test_session):
     # Verify password hash can be verified
     assert pwd_context.verify("Test1234!", db_user.password_hash)
 
-    # Cleanup
-    await test_session.execute(delete(User))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_create_user_with_none_input(user_service):
@@ -89,10 +80,6 @@ async def test_create_user_duplicate_email(user_service, test_session):
     """
     Test create() raises ValueError when email already exists
     """
-    # Ensure database is empty
-    await test_session.execute(delete(User))
-    await test_session.commit()
-
     # Create first user
     user_data1 = UserCreate(
         name="測試",
@@ -126,25 +113,16 @@ async def test_create_user_duplicate_email(user_service, test_session):
 
     # Verify only one user exists in database
     statement = select(User)
-    db_result = await test_session.execute(statement)
-    users = db_result.scalars().all()
+    users = (await test_session.scalars(statement)).all()
     assert len(users) == 1
     assert users[0].email == "duplicate@example.com"
 
-    # Cleanup
-    await test_session.execute(delete(User))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_create_user_password_is_hashed(user_service, test_session):
     """
     Test create() properly hashes the password
     """
-    # Ensure database is empty
-    await test_session.execute(delete(User))
-    await test_session.commit()
-
     password = "SecurePass123!"
     user_data = UserCreate(
         name="測試",
@@ -161,8 +139,7 @@ async def test_create_user_password_is_hashed(user_service, test_session):
 
     # Verify password is hashed in database
     statement = select(User).where(User.id == result.id)
-    db_result = await test_session.execute(statement)
-    db_user = db_result.scalar_one_or_none()
+    db_user = (await test_session.scalars(statement)).one_or_none()
 
     assert db_user is not None
     assert db_user.password_hash != password
@@ -173,20 +150,12 @@ async def test_create_user_password_is_hashed(user_service, test_session):
     wrong_password = "WrongPassword123!"
     assert not pwd_context.verify(wrong_password, db_user.password_hash)
 
-    # Cleanup
-    await test_session.execute(delete(User))
-    await test_session.commit()
-
 
 @pytest.mark.asyncio
 async def test_create_user_timestamps_set(user_service, test_session):
     """
     Test create() sets created_at and updated_at timestamps
     """
-    # Ensure database is empty
-    await test_session.execute(delete(User))
-    await test_session.commit()
-
     user_data = UserCreate(
         name="測試",
         email="timestamp@example.com",
@@ -202,8 +171,7 @@ async def test_create_user_timestamps_set(user_service, test_session):
 
     # Verify timestamps are set in database
     statement = select(User).where(User.id == result.id)
-    db_result = await test_session.execute(statement)
-    db_user = db_result.scalar_one_or_none()
+    db_user = (await test_session.scalars(statement)).one_or_none()
 
     assert db_user is not None
     assert db_user.created_at is not None
@@ -212,7 +180,3 @@ async def test_create_user_timestamps_set(user_service, test_session):
     # (created and updated at same time)
     time_diff = abs((db_user.created_at - db_user.updated_at).total_seconds())
     assert time_diff < 1  # Should be within 1 second
-
-    # Cleanup
-    await test_session.execute(delete(User))
-    await test_session.commit()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON 序列化後端
+依序選用 orjson、ujson，皆未安裝時退回標準函式庫 json；
+dumps 一律輸出縮排 2 格、保留中文的 UTF-8 bytes
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    BACKEND = "orjson"
+
+    def dumps(obj: Any) -> bytes:
+        """序列化為 JSON（UTF-8 bytes）"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    loads = orjson.loads
+
+except ImportError:
+    try:
+        import ujson
+
+        BACKEND = "ujson"
+
+        def dumps(obj: Any) -> bytes:
+            """序列化為 JSON（UTF-8 bytes）"""
+            return ujson.dumps(
+                obj, ensure_ascii=False, indent=2, escape_forward_slashes=False
+            ).encode("utf-8")
+
+        loads = ujson.loads
+
+    except ImportError:
+        import json
+
+        BACKEND = "json"
+
+        def dumps(obj: Any) -> bytes:
+            """序列化為 JSON（UTF-8 bytes）"""
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+        loads = json.loads
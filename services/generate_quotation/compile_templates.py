@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+模板預先編譯工具
+將模板目錄中的 Jinja2 模板編譯為 Python 模組，生成器執行時直接載入，
+不再讀取、解析模板原始檔；修改模板後需重新執行
+"""
+
+import shutil
+import sys
+
+from pdf_generator import HTMLPDFGenerator, compiled_template_dir
+
+
+def compile_templates(template_dir: str = "templates") -> str:
+    """
+    編譯模板目錄中的所有模板
+
+    Args:
+        template_dir: 模板目錄路徑
+
+    Returns:
+        編譯結果的輸出目錄
+    """
+    target = compiled_template_dir(template_dir)
+    # 清除舊的編譯結果，避免已刪除的模板殘留
+    shutil.rmtree(target, ignore_errors=True)
+
+    # 使用生成器的 Jinja2 環境，確保編譯時的設定與過濾器和執行時一致
+    generator = HTMLPDFGenerator(template_dir)
+    generator.jinja_env.compile_templates(
+        target,
+        zip=None,
+        # 只編譯 Jinja2 模板，styles.css 由 WeasyPrint 直接讀取
+        filter_func=lambda name: name.endswith(".html"),
+        ignore_errors=False,
+    )
+    return target
+
+
+def main():
+    """主程式入口"""
+    template_dir = sys.argv[1] if len(sys.argv) > 1 else "templates"
+    target = compile_templates(template_dir)
+    print(f"✓ 模板已編譯至：{target}")
+
+
+if __name__ == "__main__":
+    main()
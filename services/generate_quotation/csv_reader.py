@@ -6,161 +6,343 @@ CSV 讀取模組
 """
 
 import csv
-from typing import Any, Dict, List
-
-
-class CSVReader:
-    """CSV 讀取器"""
-
-    def __init__(self):
-        pass
-
-    def read_csv_to_json(self, csv_file_path: str) -> List[Dict[str, Any]]:
-        """
-        讀取 CSV 檔案並轉換為 JSON 格式
-
-        Args:
-            csv_file_path: CSV 檔案路徑
-
-        Returns:
-            包含所有客戶資料的 JSON 列表
-        """
-        invoices = []
-
-        with open(csv_file_path, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-
-            for row in reader:
-                # 基本客戶資訊
-                invoice_data = {
-                    "customer_name": row.get("客戶名稱", ""),
-                    "contact_person": row.get("聯絡人", ""),
-                    "phone": row.get("電話", ""),
-                    "invoice_title": row.get("發票抬頭", ""),
-                    "tax_id": row.get("客戶統編", ""),
-                    "invoice_number": row.get("發票號碼", ""),
-                    "invoice_issue_date": row.get("發票日期", ""),
-                    "invoice_type": row.get("發票", ""),
-                    "notes": row.get("備註", ""),
-                    "items": [],
-                }
-
-                # 處理品項資料（最多4個品項）
-                for i in range(1, 5):
-                    item_name_key = f"品項{i}"
-                    # 新版欄位以 數量{i} / 單價{i} 命名（包含第1筆）
-                    quantity_key = f"數量{i}"
-                    unit_price_key = f"單價{i}"
-
-                    item_name = (row.get(item_name_key, "") or "").strip()
-                    quantity = (row.get(quantity_key, "") or "").strip()
-                    unit_price = (row.get(unit_price_key, "") or "").strip()
-
-                    # 如果品項名稱不為空，則加入品項
-                    if item_name:
-                        invoice_data["items"].append(
-                            {
-                                "name": item_name,
-                                "quantity": quantity,
-                                "unit_price": unit_price,
-                                "amount": "",  # 金額將由 PDF 生成器自動計算
-                            }
-                        )
-
-                invoices.append(invoice_data)
-
-        return invoices
-
-    def validate_csv_format(self, csv_file_path: str) -> bool:
-        """
-        驗證 CSV 檔案格式是否正確
-
-        Args:
-            csv_file_path: CSV 檔案路徑
-
-        Returns:
-            格式是否正確
-        """
-        try:
-            with open(csv_file_path, "r", encoding="utf-8") as file:
-                reader = csv.DictReader(file)
-                headers = reader.fieldnames
-
-                # 針對新版 CSV 的必要欄位（其餘欄位視為可選）
-                required_fields = [
-                    "客戶名稱",
-                    "發票",
-                    "品項1",
-                    "數量1",
-                    "單價1",
-                ]
-
-                for field in required_fields:
-                    if field not in headers:
-                        print(f"✗ 缺少必要欄位: {field}")
-                        return False
-
-                print("✓ CSV 檔案格式驗證通過")
-                return True
-
-        except Exception as e:
-            print(f"✗ CSV 檔案讀取錯誤: {e}")
-            return False
-
-    def get_csv_info(self, csv_file_path: str) -> Dict[str, Any]:
-        """
-        取得 CSV 檔案基本資訊
-
-        Args:
-            csv_file_path: CSV 檔案路徑
-
-        Returns:
-            CSV 檔案資訊
-        """
-        try:
-            with open(csv_file_path, "r", encoding="utf-8") as file:
-                reader = csv.DictReader(file)
-                headers = reader.fieldnames
-
-                # 計算行數
-                row_count = sum(1 for row in reader)
-
-                return {
-                    "file_path": csv_file_path,
-                    "headers": headers,
-                    "row_count": row_count,
-                    "encoding": "utf-8",
-                }
-        except Exception as e:
-            return {"error": str(e)}
-
-
-def main():
+import functools
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Sequence, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 品項欄位（最多4個品項）
+# 新版欄位以 數量{i} / 單價{i} 命名（包含第1筆）
+ITEM_COLUMNS = (
+    ("品項1", "數量1", "單價1"),
+    ("品項2", "數量2", "單價2"),
+    ("品項3", "數量3", "單價3"),
+    ("品項4", "數量4", "單價4"),
+)
+
+# 針對新版 CSV 的必要欄位（其餘欄位視為可選）
+REQUIRED_FIELDS = ("客戶名稱", "發票", "品項1", "數量1", "單價1")
+
+
+@dataclass(slots=True)
+class InvoiceItem:
+    """CSV 中的一筆品項"""
+
+    name: str
+    quantity: str
+    unit_price: str
+    amount: str = ""  # 金額將由 PDF 生成器自動計算
+
+    def to_dict(self) -> Dict[str, Any]:
+        """轉換為 JSON 格式的品項"""
+        return {
+            "name": self.name,
+            "quantity": self.quantity,
+            "unit_price": self.unit_price,
+            "amount": self.amount,
+        }
+
+
+@dataclass(slots=True)
+class InvoiceRecord:
+    """CSV 中的一列請款單資料"""
+
+    customer_name: str
+    contact_person: str
+    phone: str
+    invoice_title: str
+    tax_id: str
+    invoice_number: str
+    invoice_issue_date: str
+    invoice_type: str
+    notes: str
+    items: List[InvoiceItem]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """轉換為 JSON 格式的請款單"""
+        return {
+            "customer_name": self.customer_name,
+            "contact_person": self.contact_person,
+            "phone": self.phone,
+            "invoice_title": self.invoice_title,
+            "tax_id": self.tax_id,
+            "invoice_number": self.invoice_number,
+            "invoice_issue_date": self.invoice_issue_date,
+            "invoice_type": self.invoice_type,
+            "notes": self.notes,
+            "items": [item.to_dict() for item in self.items],
+        }
+
+
+def analyze(
+    csv_file_path: str,
+) -> Tuple[bool, Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    讀取 CSV 檔案一次，同時完成格式驗證、檔案資訊與資料轉換
+
+    Args:
+        csv_file_path: CSV 檔案路徑
+
+    Returns:
+        (格式是否正確, CSV 檔案資訊, 請款單資料；格式不正確時為空列表)
+    """
+    try:
+        headers, records = _load(csv_file_path)
+    except Exception as e:
+        logger.error("✗ CSV 檔案讀取錯誤: %s", e)
+        return False, {"error": str(e)}, []
+
+    info = _csv_info(csv_file_path, headers, records)
+    if not _check_headers(headers):
+        return False, info, []
+
+    return True, info, [record.to_dict() for record in records]
+
+
+def read_csv_to_json(csv_file_path: str) -> List[Dict[str, Any]]:
+    """
+    讀取 CSV 檔案並轉換為 JSON 格式
+
+    Args:
+        csv_file_path: CSV 檔案路徑
+
+    Returns:
+        包含所有客戶資料的 JSON 列表
+    """
+    _, records = _load(csv_file_path)
+    return [record.to_dict() for record in records]
+
+
+def iter_csv_to_json(csv_file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    逐筆產生 JSON 格式的請款單，不一次建立整份列表
+
+    Args:
+        csv_file_path: CSV 檔案路徑
+
+    Yields:
+        單筆請款單資料
+    """
+    # 直接逐列讀取，不經過 _load 的快取，記憶體中同時只保留一筆請款單
+    with _open_csv(csv_file_path) as file:
+        reader = csv.reader(file)
+        headers = next(reader, None)
+        if headers is None:
+            return
+        for record in _iter_records(reader, headers):
+            yield record.to_dict()
+
+
+def _load(csv_file_path: str) -> Tuple[Tuple[str, ...], Tuple[InvoiceRecord, ...]]:
+    """
+    讀取並解析 CSV 檔案；檔案未變更時直接回傳上次的解析結果
+
+    Args:
+        csv_file_path: CSV 檔案路徑
+
+    Returns:
+        (欄位名稱, 請款單資料)
+    """
+    stat = os.stat(csv_file_path)
+    return _parse(csv_file_path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse(
+    csv_file_path: str, mtime_ns: int, size: int
+) -> Tuple[Tuple[str, ...], Tuple[InvoiceRecord, ...]]:
+    """
+    讀取 CSV 檔案一次，取得欄位名稱與請款單資料
+
+    Args:
+        csv_file_path: CSV 檔案路徑
+        mtime_ns: 檔案修改時間（僅作為快取鍵，檔案變更時重新解析）
+        size: 檔案大小（僅作為快取鍵）
+
+    Returns:
+        (欄位名稱, 請款單資料)；結果由快取共用，以 tuple 回傳避免被呼叫端修改
+    """
+    with _open_csv(csv_file_path) as file:
+        reader = csv.reader(file)
+        headers = next(reader, None)
+        if headers is None:
+            return (), ()
+        return tuple(headers), tuple(_iter_records(reader, headers))
+
+
+def _open_csv(csv_file_path: str) -> TextIO:
+    """開啟 CSV 檔案"""
+    # newline="" 交由 csv 模組處理換行（含欄位內換行），並以 1 MiB 緩衝讀取
+    return open(csv_file_path, "r", encoding="utf-8", newline="", buffering=1 << 20)
+
+
+def _iter_records(
+    reader: Iterator[List[str]], headers: List[str]
+) -> Iterator[InvoiceRecord]:
+    """
+    逐列解析 CSV 資料列，每完成一列即產生一筆請款單
+
+    Args:
+        reader: 已讀過欄位名稱列的 csv.reader
+        headers: 欄位名稱
+
+    Yields:
+        單筆請款單資料
+    """
+    # 先把欄位名稱換成索引，之後每一列直接以位置取值；
+    # 缺少的欄位指向每列最後補上的空白欄
+    n_cols = len(headers)
+    index = {header: i for i, header in enumerate(headers)}
+
+    def column(name: str) -> int:
+        return index.get(name, n_cols)
+
+    customer_name = column("客戶名稱")
+    contact_person = column("聯絡人")
+    phone = column("電話")
+    invoice_title = column("發票抬頭")
+    tax_id = column("客戶統編")
+    invoice_number = column("發票號碼")
+    invoice_issue_date = column("發票日期")
+    invoice_type = column("發票")
+    notes = column("備註")
+    item_columns = [
+        (column(name), column(quantity), column(unit_price))
+        for name, quantity, unit_price in ITEM_COLUMNS
+    ]
+    padding = [""] * (n_cols + 1)
+
+    row: List[str]
+    for row in reader:
+        # 跳過空白列
+        if not row:
+            continue
+        if len(row) == n_cols:
+            row.append("")
+        else:
+            # 欄位數不符的列：截斷多餘欄位或補空白
+            row = (row[:n_cols] + padding)[: n_cols + 1]
+
+        items: List[InvoiceItem] = []
+        for name_col, quantity_col, unit_price_col in item_columns:
+            item_name = row[name_col].strip()
+
+            # 如果品項名稱不為空，則加入品項
+            if item_name:
+                items.append(
+                    InvoiceItem(
+                        item_name,
+                        row[quantity_col].strip(),
+                        row[unit_price_col].strip(),
+                    )
+                )
+
+        # 基本客戶資訊
+        yield InvoiceRecord(
+            row[customer_name],
+            row[contact_person],
+            row[phone],
+            row[invoice_title],
+            row[tax_id],
+            row[invoice_number],
+            row[invoice_issue_date],
+            row[invoice_type],
+            row[notes],
+            items,
+        )
+
+
+def _check_headers(headers: Sequence[str]) -> bool:
+    """檢查必要欄位並輸出驗證結果"""
+    header_set = set(headers)
+    missing = [field for field in REQUIRED_FIELDS if field not in header_set]
+    if missing:
+        logger.error("✗ 缺少必要欄位: %s", ", ".join(missing))
+        return False
+
+    logger.info("✓ CSV 檔案格式驗證通過")
+    return True
+
+
+def _csv_info(
+    csv_file_path: str,
+    headers: Sequence[str],
+    invoices: Sequence[InvoiceRecord],
+) -> Dict[str, Any]:
+    """組出 CSV 檔案基本資訊"""
+    # 每一列資料對應一筆請款單
+    return {
+        "file_path": csv_file_path,
+        "headers": list(headers),
+        "row_count": len(invoices),
+        "encoding": "utf-8",
+    }
+
+
+def validate_csv_format(csv_file_path: str) -> bool:
+    """
+    驗證 CSV 檔案格式是否正確
+
+    Args:
+        csv_file_path: CSV 檔案路徑
+
+    Returns:
+        格式是否正確
+    """
+    try:
+        headers, _ = _load(csv_file_path)
+    except Exception as e:
+        logger.error("✗ CSV 檔案讀取錯誤: %s", e)
+        return False
+
+    return _check_headers(headers)
+
+
+def get_csv_info(csv_file_path: str) -> Dict[str, Any]:
+    """
+    取得 CSV 檔案基本資訊
+
+    Args:
+        csv_file_path: CSV 檔案路徑
+
+    Returns:
+        CSV 檔案資訊
+    """
+    try:
+        headers, invoices = _load(csv_file_path)
+    except Exception as e:
+        return {"error": str(e)}
+
+    return _csv_info(csv_file_path, headers, invoices)
+
+
+def main() -> None:
     """測試 CSV 讀取功能"""
-    reader = CSVReader()
+    # 命令列執行時顯示處理訊息；作為模組匯入時預設只輸出 WARNING 以上
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
     # 測試讀取 CSV
     csv_file = "invoice_data.csv"
     print(f"正在讀取 CSV 檔案: {csv_file}")
 
-    # 驗證格式
-    if not reader.validate_csv_format(csv_file):
+    # 驗證格式、取得檔案資訊並讀取資料（只讀取檔案一次）
+    is_valid, info, invoices = analyze(csv_file)
+    if not is_valid:
         return
 
-    # 取得檔案資訊
-    info = reader.get_csv_info(csv_file)
     print(f"檔案資訊: {info}")
-
-    # 讀取資料
-    invoices = reader.read_csv_to_json(csv_file)
     print(f"✓ 成功讀取 {len(invoices)} 筆請款單資料")
 
     # 顯示第一筆資料
     if invoices:
         print("\n第一筆資料:")
-        import json
+        import _json_backend
 
-        print(json.dumps(invoices[0], ensure_ascii=False, indent=2))
+        print(_json_backend.dumps(invoices[0]).decode())
 
 
 if __name__ == "__main__":
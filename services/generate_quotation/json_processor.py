@@ -5,18 +5,75 @@ JSON 資料處理器
 處理 JSON 格式的請款單資料
 """
 
-import json
+import logging
 import os
-from typing import Any, Dict, List, Union
+import sys
+from typing import Any, Dict, Iterable, List, Union
 
-from csv_reader import CSVReader
+import _json_backend
+from csv_reader import iter_csv_to_json
+
+logger = logging.getLogger(__name__)
+
+# 新版資料：僅要求關鍵欄位，其餘視為可選
+_REQUIRED_INVOICE_FIELDS = frozenset(("customer_name", "invoice_type", "items"))
+_REQUIRED_ITEM_FIELDS = frozenset(("name", "quantity", "unit_price", "amount"))
+
+
+def _write_json(data: Any, json_file_path: str):
+    """以縮排 2 格、保留中文的格式寫入 JSON 檔案"""
+    with open(json_file_path, "wb") as f:
+        f.write(_json_backend.dumps(data))
+
+
+def _write_json_array(items: Iterable[Any], json_file_path: str) -> int:
+    """
+    逐筆序列化並寫入 JSON 陣列，輸出格式與 _write_json 相同
+
+    先寫入同目錄的暫存檔，全部寫完才取代目標檔案；
+    讀取來源途中發生錯誤時，原有的輸出檔案維持不變
+
+    Returns:
+        寫入的筆數
+    """
+    count = 0
+    # 暫存檔與目標位於同一目錄，os.replace 才能原子地取代
+    tmp_path = f"{json_file_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            for item in items:
+                chunk = _json_backend.dumps(item)
+                # 陣列元素需再縮排一層（JSON 字串內的換行已被跳脫，可直接替換）
+                f.write(b"[\n  " if count == 0 else b",\n  ")
+                f.write(chunk.replace(b"\n", b"\n  "))
+                count += 1
+            f.write(b"\n]" if count else b"[]")
+        os.replace(tmp_path, json_file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return count
+
+
+def _read_json(json_file_path: str) -> Any:
+    """讀取 JSON 檔案"""
+    with open(json_file_path, "rb") as f:
+        return _json_backend.loads(f.read())
+
+
+def _safe_float(value: Any) -> float:
+    """轉換金額為浮點數，空值或無法轉換時視為 0"""
+    try:
+        return float(value) if value else 0.0
+    except (TypeError, ValueError):
+        return 0.0
 
 
 class JSONProcessor:
     """JSON 資料處理器"""
 
-    def __init__(self):
-        self.csv_reader = CSVReader()
+    __slots__ = ()
 
     def csv_to_json_file(self, csv_file_path: str, json_file_path: str):
         """
@@ -27,18 +84,14 @@ class JSONProcessor:
             json_file_path: 輸出 JSON 檔案路徑
         """
         try:
-            # 讀取 CSV 資料
-            invoices = self.csv_reader.read_csv_to_json(csv_file_path)
+            # 逐筆讀取 CSV 資料並寫入 JSON 檔案
+            count = _write_json_array(iter_csv_to_json(csv_file_path), json_file_path)
 
-            # 寫入 JSON 檔案
-            with open(json_file_path, "w", encoding="utf-8") as f:
-                json.dump(invoices, f, ensure_ascii=False, indent=2)
-
-            print(f"✓ CSV 已轉換為 JSON：{json_file_path}")
-            print(f"  包含 {len(invoices)} 筆請款單資料")
+            logger.info("✓ CSV 已轉換為 JSON：%s", json_file_path)
+            logger.info("  包含 %d 筆請款單資料", count)
 
         except Exception as e:
-            print(f"✗ CSV 轉 JSON 失敗：{e}")
+            logger.error("✗ CSV 轉 JSON 失敗：%s", e)
             raise
 
     def load_json_file(
@@ -54,14 +107,13 @@ class JSONProcessor:
             JSON 資料
         """
         try:
-            with open(json_file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json(json_file_path)
 
-            print(f"✓ JSON 檔案已載入：{json_file_path}")
+            logger.info("✓ JSON 檔案已載入：%s", json_file_path)
             return data
 
         except Exception as e:
-            print(f"✗ JSON 檔案載入失敗：{e}")
+            logger.error("✗ JSON 檔案載入失敗：%s", e)
             raise
 
     def save_json_file(
@@ -75,13 +127,12 @@ class JSONProcessor:
             json_file_path: JSON 檔案路徑
         """
         try:
-            with open(json_file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            _write_json(data, json_file_path)
 
-            print(f"✓ 資料已儲存為 JSON：{json_file_path}")
+            logger.info("✓ 資料已儲存為 JSON：%s", json_file_path)
 
         except Exception as e:
-            print(f"✗ JSON 檔案儲存失敗：{e}")
+            logger.error("✗ JSON 檔案儲存失敗：%s", e)
             raise
 
     def validate_json_structure(
@@ -107,11 +158,11 @@ class JSONProcessor:
                 if not self._validate_single_invoice(data):
                     return False
 
-            print("✓ JSON 資料結構驗證通過")
+            logger.info("✓ JSON 資料結構驗證通過")
             return True
 
         except Exception as e:
-            print(f"✗ JSON 資料結構驗證失敗：{e}")
+            logger.error("✗ JSON 資料結構驗證失敗：%s", e)
             return False
 
     def _validate_single_invoice(self, invoice: Dict[str, Any]) -> bool:
@@ -124,29 +175,21 @@ class JSONProcessor:
         Returns:
             結構是否正確
         """
-        # 新版資料：僅要求關鍵欄位，其餘視為可選
-        required_fields = [
-            "customer_name",
-            "invoice_type",
-            "items",
-        ]
-
-        for field in required_fields:
-            if field not in invoice:
-                print(f"✗ 缺少必要欄位：{field}")
-                return False
+        missing = _REQUIRED_INVOICE_FIELDS - invoice.keys()
+        if missing:
+            logger.error("✗ 缺少必要欄位：%s", ", ".join(sorted(missing)))
+            return False
 
         # 驗證品項結構
         if not isinstance(invoice["items"], list):
-            print("✗ items 必須是列表")
+            logger.error("✗ items 必須是列表")
             return False
 
         for item in invoice["items"]:
-            item_fields = ["name", "quantity", "unit_price", "amount"]
-            for field in item_fields:
-                if field not in item:
-                    print(f"✗ 品項缺少必要欄位：{field}")
-                    return False
+            missing = _REQUIRED_ITEM_FIELDS - item.keys()
+            if missing:
+                logger.error("✗ 品項缺少必要欄位：%s", ", ".join(sorted(missing)))
+                return False
 
         return True
 
@@ -164,54 +207,40 @@ class JSONProcessor:
         """
         if isinstance(data, list):
             # 多個請款單
-            total_items = sum(len(invoice.get("items", [])) for invoice in data)
-            total_amount = 0
-
-            for invoice in data:
-                for item in invoice.get("items", []):
-                    try:
-                        amount = (
-                            float(item.get("amount", 0)) if item.get("amount") else 0
-                        )
-                        total_amount += amount
-                    except (ValueError, TypeError):
-                        continue
-
-            return {
+            info = {
                 "type": "multiple_invoices",
                 "invoice_count": len(data),
-                "total_items": total_items,
-                "total_amount": total_amount,
-                "tax_amount": total_amount * 0.05,
-                "final_total": total_amount * 1.05,
+                "total_items": sum(len(invoice.get("items", ())) for invoice in data),
             }
+            total_amount = sum(
+                _safe_float(item.get("amount"))
+                for invoice in data
+                for item in invoice.get("items", ())
+            )
         else:
             # 單一請款單
             items = data.get("items", [])
-            total_amount = 0
-
-            for item in items:
-                try:
-                    amount = float(item.get("amount", 0)) if item.get("amount") else 0
-                    total_amount += amount
-                except (ValueError, TypeError):
-                    continue
-
-            return {
+            info = {
                 "type": "single_invoice",
                 "customer_name": data.get("customer_name", ""),
                 "item_count": len(items),
-                "total_amount": total_amount,
-                "tax_amount": total_amount * 0.05,
-                "final_total": total_amount * 1.05,
             }
+            total_amount = sum(_safe_float(item.get("amount")) for item in items)
+
+        info["total_amount"] = total_amount
+        info["tax_amount"] = total_amount * 0.05
+        info["final_total"] = total_amount * 1.05
+        return info
 
-    def create_sample_json(self, output_path: str):
+    def create_sample_json(self, output_path: str) -> List[Dict[str, Any]]:
         """
         建立範例 JSON 檔案
 
         Args:
             output_path: 輸出檔案路徑
+
+        Returns:
+            寫入檔案的範例資料
         """
         sample_data = [
             {
@@ -261,21 +290,27 @@ class JSONProcessor:
         ]
 
         self.save_json_file(sample_data, output_path)
-        print(f"✓ 範例 JSON 檔案已建立：{output_path}")
+        logger.info("✓ 範例 JSON 檔案已建立：%s", output_path)
+        return sample_data
 
-    def convert_csv_to_json(self, csv_file_path: str, json_file_path: str = None):
+    def convert_csv_to_json(
+        self, csv_file_path: str, json_file_path: str = None, validate: bool = False
+    ):
         """
         將 CSV 檔案轉換為 JSON 檔案（便利方法）
 
         Args:
             csv_file_path: CSV 檔案路徑
             json_file_path: 輸出 JSON 檔案路徑（可選）
+            validate: 是否重新載入輸出檔案驗證結構並顯示資訊
         """
         if json_file_path is None:
             base_name = os.path.splitext(os.path.basename(csv_file_path))[0]
             json_file_path = f"{base_name}.json"
 
         self.csv_to_json_file(csv_file_path, json_file_path)
+        if not validate:
+            return
 
         # 驗證轉換結果
         data = self.load_json_file(json_file_path)
@@ -283,11 +318,13 @@ class JSONProcessor:
 
         # 顯示資訊
         info = self.get_json_info(data)
-        print(f"轉換資訊：{info}")
+        logger.info("轉換資訊：%s", info)
 
 
 def main():
     """測試 JSON 處理功能"""
+    # 命令列執行時顯示處理訊息；作為模組匯入時預設只輸出 WARNING 以上
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     processor = JSONProcessor()
 
     # 測試 CSV 轉 JSON
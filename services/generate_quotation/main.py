@@ -5,10 +5,12 @@ PDF 請款單生成器主程式
 使用 Jinja2 + WeasyPrint 生成 PDF 請款單
 """
 
+import logging
 import os
 import sys
+from typing import Any, Dict, List, Union
 
-from csv_reader import CSVReader
+from csv_reader import analyze
 from json_processor import JSONProcessor
 from pdf_generator import HTMLPDFGenerator
 
@@ -16,11 +18,68 @@ from pdf_generator import HTMLPDFGenerator
 class InvoiceProcessor:
     """請款單處理器"""
 
+    __slots__ = ("html_generator", "json_processor")
+
     def __init__(self):
-        self.csv_reader = CSVReader()
         self.html_generator = HTMLPDFGenerator()
         self.json_processor = JSONProcessor()
 
+    def process(
+        self,
+        source: Union[str, Dict[str, Any], List[Dict[str, Any]]],
+        output_path: str = None,
+    ):
+        """
+        依輸入自動選擇處理流程並生成 PDF 請款單
+
+        Args:
+            source: CSV / JSON 檔案路徑，或已載入的請款單資料（dict 或 list）
+            output_path: 輸出 PDF 檔案路徑（可選）
+        """
+        if isinstance(source, (dict, list)):
+            return self.process_data_to_pdf(source, output_path)
+
+        extension = os.path.splitext(source)[1].lower()
+        if extension == ".csv":
+            return self.process_csv_to_pdf(source, output_path)
+        if extension == ".json":
+            return self.process_json_to_pdf(source, output_path)
+
+        print(f"✗ 錯誤：不支援的檔案格式 {source}")
+        return False
+
+    def process_data_to_pdf(
+        self,
+        data: Union[Dict[str, Any], List[Dict[str, Any]]],
+        output_path: str = None,
+    ):
+        """
+        直接以記憶體中的請款單資料生成 PDF，不經過中間檔案
+
+        Args:
+            data: 單一請款單或請款單列表
+            output_path: 輸出 PDF 檔案路徑（可選）
+        """
+        try:
+            if not self.json_processor.validate_json_structure(data):
+                return False
+            if data == []:
+                print("✗ 沒有請款單資料，未生成 PDF")
+                return False
+
+            if output_path is None:
+                output_path = "invoices_html.pdf"
+
+            print("正在生成 PDF 請款單...")
+            self.html_generator.generate_from_data(data, output_path)
+
+            print(f"✓ 處理完成！PDF 檔案已生成：{output_path}")
+            return True
+
+        except Exception as e:
+            print(f"✗ 處理過程中發生錯誤：{str(e)}")
+            return False
+
     def process_csv_to_pdf(self, csv_file_path: str, output_path: str = None):
         """
         處理 CSV 檔案並生成 PDF 請款單
@@ -35,19 +94,16 @@ class InvoiceProcessor:
                 print(f"✗ 錯誤：找不到 CSV 檔案 {csv_file_path}")
                 return False
 
-            # 驗證 CSV 格式
-            print("正在驗證 CSV 檔案格式...")
-            if not self.csv_reader.validate_csv_format(csv_file_path):
+            # 驗證 CSV 格式並讀取資料（只讀取檔案一次）
+            print("正在驗證並讀取 CSV 檔案...")
+            is_valid, csv_info, invoices = analyze(csv_file_path)
+            if not is_valid:
+                return False
+            if not invoices:
+                print(f"✗ CSV 檔案 {csv_file_path} 沒有請款單資料，未生成 PDF")
                 return False
-
-            # 讀取 CSV 資料
-            print("正在讀取 CSV 檔案...")
-            invoices = self.csv_reader.read_csv_to_json(csv_file_path)
             print(f"✓ 成功讀取 {len(invoices)} 筆請款單資料")
 
-            # 顯示處理資訊
-            csv_info = self.csv_reader.get_csv_info(csv_file_path)
-
             # 使用 PDF 生成器處理數據以獲得正確的金額計算
             processed_invoices = []
             total_amount = 0
@@ -117,6 +173,9 @@ class InvoiceProcessor:
             print("正在驗證 JSON 資料結構...")
             if not self.json_processor.validate_json_structure(data):
                 return False
+            if data == []:
+                print(f"✗ JSON 檔案 {json_file_path} 沒有請款單資料，未生成 PDF")
+                return False
 
             # 顯示資料資訊
             json_info = self.json_processor.get_json_info(data)
@@ -141,7 +200,7 @@ class InvoiceProcessor:
 
             # 生成 PDF
             print("\n正在生成 PDF 請款單...")
-            self.html_generator.generate_from_json(json_file_path, output_path)
+            self.html_generator.generate_from_data(data, output_path)
 
             print(f"✓ 處理完成！PDF 檔案已生成：{output_path}")
             return True
@@ -164,7 +223,9 @@ class InvoiceProcessor:
                 json_file_path = f"{base_name}.json"
 
             print("正在將 CSV 轉換為 JSON...")
-            self.json_processor.convert_csv_to_json(csv_file_path, json_file_path)
+            self.json_processor.convert_csv_to_json(
+                csv_file_path, json_file_path, validate=False
+            )
 
             return True
 
@@ -176,13 +237,10 @@ class InvoiceProcessor:
         """建立範例資料"""
         try:
             print("正在建立範例 JSON 資料...")
-            self.json_processor.create_sample_json("sample_invoices.json")
+            sample_data = self.json_processor.create_sample_json("sample_invoices.json")
 
             print("正在建立範例 PDF...")
-            self.json_processor.load_json_file("sample_invoices.json")
-            self.html_generator.generate_from_json(
-                "sample_invoices.json", "sample_invoices.pdf"
-            )
+            self.html_generator.generate_from_data(sample_data, "sample_invoices.pdf")
 
             print("✓ 範例資料已建立")
             return True
@@ -194,6 +252,8 @@ class InvoiceProcessor:
 
 def main():
     """主程式入口"""
+    # 命令列執行時顯示處理訊息；作為模組匯入時預設只輸出 WARNING 以上
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     processor = InvoiceProcessor()
 
     # 預設檔案
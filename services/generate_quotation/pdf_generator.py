@@ -5,20 +5,239 @@ HTML PDF 生成器
 使用 Jinja2 + WeasyPrint 生成 PDF 請款單
 """
 
-import json
+import logging
+import math
 import os
+import sys
 from datetime import datetime
-from typing import Any, Dict, List
-
-from jinja2 import Environment, FileSystemLoader
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+)
 from weasyprint import CSS, HTML
 from weasyprint.text.fonts import FontConfiguration
 import re
 
+import _json_backend
+
+logger = logging.getLogger(__name__)
+
+# 「數字月」格式的數量，例如「3月」、「 12 月 」
+_MONTH_RE = re.compile(r"\s*(\d+)\s*月\s*")
+
+# 數量中非數字、非小數點的字元（單位、空白、千分位等）
+_QTY_NON_DIGITS = re.compile(r"[^\d.]+")
+
+# 字體配置在同一行程內共用，避免每個生成器重新載入 fontconfig
+_FONT_CONFIG = FontConfiguration()
+
+# 編譯後的模板 bytecode 存放位置，讓每次執行 CLI 都不必重新編譯 invoice.html
+JINJA_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "yuyang", "jinja")
+
+# 單張與多張請款單共用的 WeasyPrint 選項；壓縮與字型子集化本來就是預設，
+# 這裡只補上圖片最佳化（模板日後加入 logo 等圖片時才有作用）。
+# 圖片在排版（render）時載入，分開排版時 render 與 write_pdf 都要傳入
+_WRITE_PDF_OPTIONS = {"optimize_images": True, "jpeg_quality": 80}
+
+
+def _calculate_item_amount(quantity: Any, unit_price: Any) -> float:
+    """計算品項金額（數量 × 單價），無法計算時回傳 0"""
+    try:
+        # 處理數量（可能包含單位，如 "2 包"）；CSV 來源一律已是字串
+        qty_str = (
+            quantity.strip() if isinstance(quantity, str) else str(quantity).strip()
+        )
+        if qty_str.isdecimal():
+            # 常見情況：純數字，不需提取
+            qty_num = float(qty_str)
+        else:
+            # 提取數字部分
+            qty_num = float(_QTY_NON_DIGITS.sub("", qty_str))
+
+        # 處理單價
+        price_str = (
+            unit_price.strip()
+            if isinstance(unit_price, str)
+            else str(unit_price).strip()
+        )
+        price_num = float(price_str)
+
+        return qty_num * price_num
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _resolve_amount(item: Dict[str, Any]) -> Any:
+    """取得品項金額；金額為空時以數量 × 單價自動計算"""
+    amount = item.get("amount")
+    if amount:
+        return amount
+    calculated_amount = _calculate_item_amount(
+        item.get("quantity", ""), item.get("unit_price", "")
+    )
+    return str(int(calculated_amount)) if calculated_amount > 0 else ""
+
+
+def _amount_to_float(amount: Any) -> float:
+    """轉換品項金額為浮點數，空值或無法轉換時視為 0"""
+    if not amount:
+        return 0.0
+    if isinstance(amount, (int, float)):
+        # 資料由其他 Python 程式傳入時金額多半已是數字，不需進入 try 區塊
+        return float(amount)
+    try:
+        return float(amount)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _totals_from_floats(
+    amounts: Iterable[float], invoice_type: str = ""
+) -> Dict[str, float]:
+    """
+    由品項金額計算小計、稅額與總計
+
+    Args:
+        amounts: 各品項金額
+        invoice_type: 發票種類
+
+    Returns:
+        包含小計、稅額、總計的字典
+    """
+    # fsum 逐項精確累加，品項多時小計也不會累積浮點誤差
+    subtotal = math.fsum(amounts)
+
+    # 根據發票種類決定是否計算稅金
+    # 只有「三聯」需計算 5% 營業稅；二聯與無發票不計稅
+    if invoice_type == "三聯":
+        tax_rate = 0.05  # 營業稅 5%
+        tax_amount = subtotal * tax_rate
+        total = subtotal + tax_amount
+    else:
+        tax_amount = 0
+        total = subtotal
+
+    return {"subtotal": subtotal, "tax": tax_amount, "total": total}
+
+
+@lru_cache(maxsize=256)
+def _formatted_totals(amounts: Tuple[float, ...], invoice_type: str) -> Dict[str, str]:
+    """
+    計算並格式化小計、稅額與總計
+
+    批次中的定期請款單品項金額常常相同，以金額與發票種類為鍵快取結果
+
+    Args:
+        amounts: 各品項金額（已轉換為浮點數）
+        invoice_type: 發票種類
+
+    Returns:
+        格式化後的小計、稅額、總計
+    """
+    totals = _totals_from_floats(amounts, invoice_type)
+    # 金額必為數字，直接格式化，不需經過 _format_number 的型別轉換
+    return {
+        "subtotal": f"{totals['subtotal']:,.0f}",
+        "tax": f"{totals['tax']:,.0f}",
+        "total": f"{totals['total']:,.0f}",
+    }
+
+
+def _format_number(value: Any) -> str:
+    """格式化數字（千分位、無小數），無法轉換時原樣輸出"""
+    try:
+        return format(float(value), ",.0f")
+    except (ValueError, TypeError):
+        return str(value)
+
+
+def _display_quantity(quantity: Any) -> str:
+    """顯示用數量：將「數字月」改為「數字個月」"""
+    qty_display = str(quantity)
+    m = _MONTH_RE.fullmatch(qty_display)
+    return f"{m.group(1)}個月" if m else qty_display
+
+
+def compiled_template_dir(template_dir: str) -> str:
+    """預先編譯模板的輸出目錄，例如 templates → templates_compiled"""
+    return os.path.normpath(template_dir) + "_compiled"
+
+
+def _template_loader(template_dir: str) -> BaseLoader:
+    """有預先編譯的模板（compile_templates.py）時直接載入，否則讀取模板原始檔"""
+    compiled_dir = compiled_template_dir(template_dir)
+    if os.path.isdir(compiled_dir):
+        return ModuleLoader(compiled_dir)
+    return FileSystemLoader(template_dir)
+
+
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    建立跨行程共用的模板 bytecode 快取；目錄無法建立、
+    不屬於目前使用者或權限無法收緊時不使用快取
+    """
+    try:
+        # 快取內容會被載入執行，目錄只開放給目前使用者；
+        # makedirs 的 mode 不會套用到既有目錄，因此另外檢查擁有者並 chmod
+        os.makedirs(JINJA_CACHE_DIR, mode=0o700, exist_ok=True)
+        if hasattr(os, "getuid") and os.stat(JINJA_CACHE_DIR).st_uid != os.getuid():
+            logger.warning(
+                "模板快取目錄不屬於目前使用者，不使用快取：%s", JINJA_CACHE_DIR
+            )
+            return None
+        os.chmod(JINJA_CACHE_DIR, 0o700)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(JINJA_CACHE_DIR)
+
+
+@lru_cache(maxsize=None)
+def _get_env(template_dir: str) -> Environment:
+    """
+    取得模板目錄對應的 Jinja2 環境，同一行程內只建立一次
+
+    Args:
+        template_dir: 模板目錄路徑
+
+    Returns:
+        已註冊過濾器的 Jinja2 環境
+    """
+    env = Environment(
+        loader=_template_loader(template_dir),
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # 模板在執行期間不會變動，不需每次取用時檢查檔案修改時間
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=_bytecode_cache(),
+    )
+
+    # 添加自定義過濾器（模組層級函式，渲染時不需綁定 self）
+    filters = env.filters
+    filters["currency"] = filters["number"] = _format_number
+    return env
+
 
 class HTMLPDFGenerator:
     """HTML PDF 生成器"""
 
+    __slots__ = (
+        "template_dir",
+        "jinja_env",
+        "font_config",
+        "_template_cache",
+        "_css_doc",
+        "_css_dir",
+    )
+
     def __init__(self, template_dir: str = "templates"):
         """
         初始化 HTML PDF 生成器
@@ -29,41 +248,18 @@ class HTMLPDFGenerator:
         self.template_dir = template_dir
         self.setup_jinja()
         self.setup_fonts()
+        # 已解析的 styles.css 與其所屬的模板目錄（目錄變更時重新載入）
+        self._css_doc = None
+        self._css_dir = None
 
     def setup_jinja(self):
-        """設定 Jinja2 環境"""
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(self.template_dir),
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
-        # 添加自定義過濾器
-        self.jinja_env.filters["currency"] = self.format_currency
-        self.jinja_env.filters["number"] = self.format_number
+        """設定 Jinja2 環境（同一模板目錄共用一個環境）"""
+        self.jinja_env = _get_env(self.template_dir)
+        self._template_cache = {}
 
     def setup_fonts(self):
         """設定字體配置"""
-        self.font_config = FontConfiguration()
-
-    def format_currency(self, value: Any) -> str:
-        """格式化貨幣"""
-        try:
-            if isinstance(value, str):
-                value = float(value)
-            return f"{value:,.0f}"
-        except (ValueError, TypeError):
-            return str(value)
-
-    def format_number(self, value: Any) -> str:
-        """格式化數字"""
-        try:
-            if isinstance(value, str):
-                value = float(value)
-            return f"{value:,.0f}"
-        except (ValueError, TypeError):
-            return str(value)
+        self.font_config = _FONT_CONFIG
 
     def get_current_date(self) -> str:
         """取得當前日期（yyyy-mm-dd 格式）"""
@@ -82,26 +278,9 @@ class HTMLPDFGenerator:
         Returns:
             包含小計、稅額、總計的字典
         """
-        subtotal = 0
-
-        for item in items:
-            try:
-                amount = float(item.get("amount", 0)) if item.get("amount") else 0
-                subtotal += amount
-            except (ValueError, TypeError):
-                continue
-
-        # 根據發票種類決定是否計算稅金
-        # 只有「三聯」需計算 5% 營業稅；二聯與無發票不計稅
-        if invoice_type == "三聯":
-            tax_rate = 0.05  # 營業稅 5%
-            tax_amount = subtotal * tax_rate
-            total = subtotal + tax_amount
-        else:
-            tax_amount = 0
-            total = subtotal
-
-        return {"subtotal": subtotal, "tax": tax_amount, "total": total}
+        return _totals_from_floats(
+            (_amount_to_float(item.get("amount")) for item in items), invoice_type
+        )
 
     def calculate_item_amount(self, quantity: str, unit_price: str) -> float:
         """
@@ -114,19 +293,7 @@ class HTMLPDFGenerator:
         Returns:
             計算後的金額
         """
-        try:
-            # 處理數量（可能包含單位，如 "2 包"）
-            qty_str = str(quantity).strip()
-            # 提取數字部分
-            qty_num = float("".join(filter(lambda x: x.isdigit() or x == ".", qty_str)))
-
-            # 處理單價
-            price_str = str(unit_price).strip()
-            price_num = float(price_str)
-
-            return qty_num * price_num
-        except (ValueError, TypeError):
-            return 0.0
+        return _calculate_item_amount(quantity, unit_price)
 
     def prepare_invoice_data(self, invoice_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -138,33 +305,23 @@ class HTMLPDFGenerator:
         Returns:
             處理後的請款單資料
         """
-        # 處理品項資料，自動計算金額
-        processed_items = []
-        for item in invoice_data.get("items", []):
-            processed_item = item.copy()
-
-            # 如果金額為空，自動計算
-            if not processed_item.get("amount") or processed_item.get("amount") == "":
-                calculated_amount = self.calculate_item_amount(
-                    processed_item.get("quantity", ""),
-                    processed_item.get("unit_price", ""),
-                )
-                processed_item["amount"] = (
-                    str(int(calculated_amount)) if calculated_amount > 0 else ""
-                )
-
-            # 顯示用數量：將「數字月」改為「數字個月」
-            qty_display = str(processed_item.get("quantity", ""))
-            m = re.fullmatch(r"\s*(\d+)\s*月\s*", qty_display)
-            if m:
-                qty_display = f"{m.group(1)}個月"
-            processed_item["display_quantity"] = qty_display
-
-            processed_items.append(processed_item)
+        # 處理品項資料，自動計算金額並加上顯示用數量
+        processed_items = [
+            {
+                **item,
+                "amount": _resolve_amount(item),
+                "display_quantity": _display_quantity(item.get("quantity", "")),
+            }
+            for item in invoice_data.get("items", ())
+        ]
 
         # 計算總金額（傳遞發票種類）
         invoice_type = invoice_data.get("invoice_type", "")
-        totals = self.calculate_totals(processed_items, invoice_type)
+        # 以轉換後的金額為快取鍵：原始金額可能是 dict / list 等無法雜湊的值
+        totals = _formatted_totals(
+            tuple(map(_amount_to_float, map(itemgetter("amount"), processed_items))),
+            invoice_type,
+        )
 
         # 處理日期欄位
         invoice_date = self.get_current_date()  # 請款日期（系統生成）
@@ -185,17 +342,44 @@ class HTMLPDFGenerator:
             "invoice_type": invoice_data.get("invoice_type", ""),
             "notes": invoice_data.get("notes", ""),
             "item_list": processed_items,  # 使用處理後的品項資料
-            "totals": {
-                "subtotal": self.format_currency(totals["subtotal"]),
-                "tax": self.format_currency(totals["tax"]),
-                "total": self.format_currency(totals["total"]),
-            },
+            # 快取中的 totals 為多張請款單共用，複製一份避免被修改
+            "totals": dict(totals),
             # 稅額說明：二聯顯示「已包含」
             "tax_note": "已包含" if invoice_type == "二聯" else "",
         }
 
         return prepared_data
 
+    def _get_css(self):
+        """
+        取得已解析的 styles.css，只在首次使用或模板目錄變更時讀取
+
+        Returns:
+            CSS 物件；模板目錄中沒有 styles.css 時為 None
+        """
+        if self._css_dir != self.template_dir:
+            css_path = os.path.join(self.template_dir, "styles.css")
+            self._css_doc = (
+                CSS(filename=css_path, font_config=self.font_config)
+                if os.path.exists(css_path)
+                else None
+            )
+            self._css_dir = self.template_dir
+        return self._css_doc
+
+    def _get_stylesheets(self) -> Optional[List[CSS]]:
+        """write_pdf 用的樣式表列表；沒有 styles.css 時為 None"""
+        css_doc = self._get_css()
+        return [css_doc] if css_doc is not None else None
+
+    def _get_template(self, template_name: str):
+        """取得已編譯的模板，同一模板只向 Jinja2 載入一次"""
+        template = self._template_cache.get(template_name)
+        if template is None:
+            template = self.jinja_env.get_template(template_name)
+            self._template_cache[template_name] = template
+        return template
+
     def generate_html(
         self, invoice_data: Dict[str, Any], template_name: str = "invoice.html"
     ) -> str:
@@ -209,7 +393,7 @@ class HTMLPDFGenerator:
         Returns:
             生成的 HTML 字串
         """
-        template = self.jinja_env.get_template(template_name)
+        template = self._get_template(template_name)
         prepared_data = self.prepare_invoice_data(invoice_data)
         html_content = template.render(invoice=prepared_data)
         return html_content
@@ -235,27 +419,18 @@ class HTMLPDFGenerator:
             # 建立 HTML 物件
             html_doc = HTML(string=html_content)
 
-            # CSS 檔案路徑
-            css_path = os.path.join(self.template_dir, "styles.css")
-
             # 生成 PDF
-            if os.path.exists(css_path):
-                css_doc = CSS(filename=css_path, font_config=self.font_config)
-                html_doc.write_pdf(
-                    output_path,
-                    stylesheets=[css_doc],
-                    font_config=self.font_config,
-                    optimize_images=True,
-                )
-            else:
-                html_doc.write_pdf(
-                    output_path, font_config=self.font_config, optimize_images=True
-                )
+            html_doc.write_pdf(
+                output_path,
+                stylesheets=self._get_stylesheets(),
+                font_config=self.font_config,
+                **_WRITE_PDF_OPTIONS,
+            )
 
-            print(f"✓ PDF 已生成：{output_path}")
+            logger.info("✓ PDF 已生成：%s", output_path)
 
         except Exception as e:
-            print(f"✗ PDF 生成失敗：{e}")
+            logger.error("✗ PDF 生成失敗：%s", e)
             raise
 
     def generate_multiple_pdfs(
@@ -273,39 +448,34 @@ class HTMLPDFGenerator:
             template_name: 模板檔案名稱
         """
         try:
-            # 為每個請款單生成 HTML
-            html_contents = []
-            for i, invoice_data in enumerate(invoices):
-                html_content = self.generate_html(invoice_data, template_name)
-
-                # 如果不是最後一個，添加分頁符
-                if i < len(invoices) - 1:
-                    html_content += '<div class="page-break"></div>'
-
-                html_contents.append(html_content)
-
-            # 合併所有 HTML 內容
-            combined_html = "\n".join(html_contents)
-
-            # 建立 HTML 物件
-            html_doc = HTML(string=combined_html)
-
-            # CSS 檔案路徑
-            css_path = os.path.join(self.template_dir, "styles.css")
+            # 為每個請款單生成 HTML（逐筆產生，生成後立即排版）
+            html_contents = (
+                self.generate_html(invoice_data, template_name)
+                for invoice_data in invoices
+            )
+
+            # 每張請款單各自排版，只對單張文件套用樣式，再合併已排好的頁面
+            # 圖片在排版時載入，圖片最佳化選項必須在 render 時就傳入
+            stylesheets = self._get_stylesheets()
+            documents = [
+                HTML(string=html_content).render(
+                    stylesheets=stylesheets,
+                    font_config=self.font_config,
+                    **_WRITE_PDF_OPTIONS,
+                )
+                for html_content in html_contents
+            ]
+            if not documents:
+                raise ValueError("沒有可生成的請款單資料")
+            pages = [page for document in documents for page in document.pages]
 
             # 生成 PDF
-            if os.path.exists(css_path):
-                css_doc = CSS(filename=css_path, font_config=self.font_config)
-                html_doc.write_pdf(
-                    output_path, stylesheets=[css_doc], font_config=self.font_config
-                )
-            else:
-                html_doc.write_pdf(output_path, font_config=self.font_config)
+            documents[0].copy(pages).write_pdf(output_path, **_WRITE_PDF_OPTIONS)
 
-            print(f"✓ 多頁 PDF 已生成：{output_path}")
+            logger.info("✓ 多頁 PDF 已生成：%s", output_path)
 
         except Exception as e:
-            print(f"✗ 多頁 PDF 生成失敗：{e}")
+            logger.error("✗ 多頁 PDF 生成失敗：%s", e)
             raise
 
     def generate_from_json(
@@ -320,19 +490,35 @@ class HTMLPDFGenerator:
             template_name: 模板檔案名稱
         """
         try:
-            with open(json_file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(json_file_path, "rb") as f:
+                data = _json_backend.loads(f.read())
 
-            # 判斷是單一請款單還是多個請款單
-            if isinstance(data, list):
-                self.generate_multiple_pdfs(data, output_path, template_name)
-            else:
-                self.generate_pdf(data, output_path, template_name)
+            self.generate_from_data(data, output_path, template_name)
 
         except Exception as e:
-            print(f"✗ 從 JSON 生成 PDF 失敗：{e}")
+            logger.error("✗ 從 JSON 生成 PDF 失敗：%s", e)
             raise
 
+    def generate_from_data(
+        self,
+        data: Union[Dict[str, Any], List[Dict[str, Any]]],
+        output_path: str,
+        template_name: str = "invoice.html",
+    ):
+        """
+        從已載入的 JSON 資料生成 PDF
+
+        Args:
+            data: 單一請款單或請款單列表
+            output_path: 輸出 PDF 檔案路徑
+            template_name: 模板檔案名稱
+        """
+        # 判斷是單一請款單還是多個請款單
+        if isinstance(data, list):
+            self.generate_multiple_pdfs(data, output_path, template_name)
+        else:
+            self.generate_pdf(data, output_path, template_name)
+
     def get_invoice_info(self, invoice_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         取得請款單資訊
@@ -357,6 +543,8 @@ class HTMLPDFGenerator:
 
 def main():
     """測試 HTML PDF 生成功能"""
+    # 命令列執行時顯示處理訊息；作為模組匯入時預設只輸出 WARNING 以上
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     generator = HTMLPDFGenerator()
 
     # 測試資料
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 服務模組為扁平結構（main.py、csv_reader.py ...），測試時直接從服務目錄匯入
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
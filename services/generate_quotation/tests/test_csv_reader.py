@@ -0,0 +1,20 @@
+import csv_reader
+
+
+def test_get_csv_info_headers_do_not_leak_into_cache(tmp_path):
+    csv_file = tmp_path / "invoice_data.csv"
+    csv_file.write_text(
+        "客戶名稱,發票,品項1,數量1,單價1\n甲,二聯,A,1,100\n", encoding="utf-8"
+    )
+
+    csv_reader.get_csv_info(str(csv_file))["headers"].clear()
+    _, info, _ = csv_reader.analyze(str(csv_file))
+    info["headers"].append("額外欄位")
+
+    assert csv_reader.get_csv_info(str(csv_file))["headers"] == [
+        "客戶名稱",
+        "發票",
+        "品項1",
+        "數量1",
+        "單價1",
+    ]
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from json_processor import JSONProcessor
+
+
+def test_csv_to_json_file_missing_csv_keeps_existing_output(tmp_path):
+    """
+    Test csv_to_json_file leaves an existing JSON output untouched
+    when the CSV file does not exist
+    """
+    json_file = tmp_path / "out.json"
+    json_file.write_text('[{"customer_name": "existing"}]', encoding="utf-8")
+
+    with pytest.raises(FileNotFoundError):
+        JSONProcessor().csv_to_json_file(str(tmp_path / "missing.csv"), str(json_file))
+
+    assert json_file.read_text(encoding="utf-8") == ('[{"customer_name": "existing"}]')
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+
+def test_csv_to_json_file_writes_all_rows(tmp_path):
+    """
+    Test csv_to_json_file writes every CSV row as a JSON invoice
+    """
+    csv_file = tmp_path / "invoices.csv"
+    csv_file.write_text(
+        "客戶名稱,發票,品項1,數量1,單價1\n"
+        "客戶A,三聯,品項A,2,100\n"
+        "客戶B,二聯,品項B,1,50\n",
+        encoding="utf-8",
+    )
+    json_file = tmp_path / "out.json"
+
+    JSONProcessor().csv_to_json_file(str(csv_file), str(json_file))
+
+    data = json.loads(json_file.read_text(encoding="utf-8"))
+    assert [invoice["customer_name"] for invoice in data] == ["客戶A", "客戶B"]
+    assert data[0]["items"] == [
+        {"name": "品項A", "quantity": "2", "unit_price": "100", "amount": ""}
+    ]
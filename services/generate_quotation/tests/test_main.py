@@ -0,0 +1,22 @@
+from main import InvoiceProcessor
+
+
+def test_process_csv_to_pdf_header_only_csv_writes_nothing(tmp_path, capsys):
+    csv_file = tmp_path / "invoice_data.csv"
+    csv_file.write_text("客戶名稱,發票,品項1,數量1,單價1\n", encoding="utf-8")
+    output_path = tmp_path / "invoice_data_html.pdf"
+
+    assert not InvoiceProcessor().process_csv_to_pdf(str(csv_file), str(output_path))
+
+    assert "沒有請款單資料" in capsys.readouterr().out
+    assert not output_path.exists()
+
+
+def test_process_json_to_pdf_empty_list_writes_nothing(tmp_path):
+    json_file = tmp_path / "invoice_data.json"
+    json_file.write_text("[]", encoding="utf-8")
+    output_path = tmp_path / "invoice_data_html.pdf"
+
+    assert not InvoiceProcessor().process_json_to_pdf(str(json_file), str(output_path))
+
+    assert not output_path.exists()
@@ -0,0 +1,14 @@
+import os
+import stat
+
+import pdf_generator
+
+
+def test_bytecode_cache_tightens_existing_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "jinja"
+    cache_dir.mkdir()
+    os.chmod(cache_dir, 0o777)
+    monkeypatch.setattr(pdf_generator, "JINJA_CACHE_DIR", str(cache_dir))
+
+    assert pdf_generator._bytecode_cache() is not None
+    assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700